@@ -11,38 +11,238 @@ The fileop method uses get_log_files to download the audit log archive.
 
 import json
 import logging
+import os
 import re
+import shutil
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tarfile
+import tempfile
+import threading
+import time
 import io
+import copy
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from pathlib import Path
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Union, BinaryIO, Iterable
 from .config import load_config, get_infoblox_creds, decode_password
+from .wapi import WAPIError
 
 # Set up module logger
 logger = logging.getLogger(__name__)
 
+# Optional fast parser for Splunk export lines (pip install pysimdjson)
+try:
+    import simdjson
+    _simdjson_parser = simdjson.Parser()
+except ImportError:
+    simdjson = None
+    _simdjson_parser = None
+
+# Without simdjson, prefer orjson over the stdlib for whole-line parsing
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Suppress SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Parsed audit logs are cached here between CLI invocations (one file per GM)
+AUDIT_CACHE_DIR = Path(tempfile.gettempdir())
+
+
+def _new_session() -> requests.Session:
+    """Create a keep-alive session with connection pooling and retries."""
+    session = requests.Session()
+    session.verify = False
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Audit log line patterns, in priority order within each field
+# Timestamp: 2024-01-15 10:30:00 / ISO format, or syslog "Jan 15 10:30:00"
+_TS_PATTERNS = (
+    re.compile(r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})'),
+    re.compile(r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})'),
+)
+# Admin patterns paired with a lowercase literal the line must contain
+_ADMIN_PATTERNS = (
+    ("admin", re.compile(r'admin[=:](\S+)', re.IGNORECASE)),
+    ("user", re.compile(r'user[=:](\S+)', re.IGNORECASE)),
+    ("by", re.compile(r'by\s+(\S+@\S+|\w+)', re.IGNORECASE)),
+)
+_OBJECT_TYPE_FIELD_RE = re.compile(r'object_type[=:\s]+(\S+)', re.IGNORECASE)
+# Action and bare object type keywords are whole words, so one pass over the
+# line's words with set lookups finds the first of each
+_WORD_RE = re.compile(r'\w+')
+_ACTION_KEYWORDS = frozenset({
+    "INSERT", "UPDATE", "DELETE", "CREATE", "MODIFY", "REMOVE", "ADD", "CHANGE"
+})
+_TYPE_KEYWORDS = frozenset({
+    "NETWORK", "ZONE", "HOST", "RECORD", "RANGE", "FIXEDADDRESS", "LEASE"
+})
+
+
+class AuditEntry:
+    """
+    One parsed line of the InfoBlox audit log.
+
+    Slotted rather than a dict, since a cached log holds one per line.
+    Supports the dict-style reads (entry["admin"], entry.get("admin"))
+    used for Splunk results, so both kinds of entry are handled alike.
+    """
+
+    __slots__ = ("raw", "timestamp", "admin", "action", "object_type", "object_name", "message")
+
+    def __init__(
+        self,
+        raw: str,
+        timestamp: Optional[str] = None,
+        admin: Optional[str] = None,
+        action: Optional[str] = None,
+        object_type: Optional[str] = None,
+        object_name: Optional[str] = None,
+        message: Optional[str] = None
+    ):
+        self.raw = raw
+        self.timestamp = timestamp
+        self.admin = admin
+        self.action = action
+        self.object_type = object_type
+        self.object_name = object_name
+        self.message = raw if message is None else message
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "AuditEntry":
+        """Build an entry from its as_dict() form (e.g., the disk cache)."""
+        return cls(**{field: data.get(field) for field in cls.__slots__})
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def as_dict(self) -> Dict[str, Optional[str]]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"AuditEntry({self.as_dict()!r})"
+
+
+# Separators for the fileop token index: anything that cannot be part of a
+# name or address, so quotes and brackets don't hide a token (CIDRs index
+# as address and prefix)
+_TOKEN_SPLIT_RE = re.compile(r'[^\w.-]+')
+
+
+def _build_token_index(audit_entries: List[Dict]) -> Dict[str, List[int]]:
+    """Map each lowercased token of an entry's text fields to entry indexes."""
+    index: Dict[str, List[int]] = {}
+    split = _TOKEN_SPLIT_RE.split
+    for i, entry in enumerate(audit_entries):
+        tokens = set()
+        for field in ("message", "object_name", "object", "raw"):
+            value = entry.get(field)
+            if value:
+                tokens.update(split(str(value).lower()))
+        tokens.discard("")
+        for token in tokens:
+            index.setdefault(token, []).append(i)
+    return index
+
+
+# Fixed export parameters sent with every Splunk search
+_SPLUNK_EXPORT_PARAMS = {
+    "output_mode": "json",
+    "earliest_time": "-90d",
+    "latest_time": "now"
+}
+
+# Fields returned for each Splunk audit event. The user and message
+# fallbacks are resolved by Splunk, so the (large) _raw text only comes
+# back when a caller needs to match against it.
+_SPLUNK_TABLE = (
+    ' | eval admin=coalesce(admin, user, src_user, Admin), message=coalesce(message, _raw)'
+    ' | table _time, admin, action, object_type, object_name, message, src, dest'
+)
+
 
 class AuditClient:
     """Retrieve audit information from Splunk or WAPI fileop."""
 
+    # Parsed audit log, shared by every client in this process
+    _audit_log_cache = None
+    _audit_log_cache_time = None
+
+    # Recent lookup results: (ref, type, name, max_results) -> (monotonic time, audit_info),
+    # least recently used first
+    _audit_info_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _audit_info_ttl = 60
+    _audit_info_max = 256
+
+    # Token -> entry indexes for the cached log, rebuilt when the list changes
+    _token_index: Dict[str, List[int]] = {}
+    _token_index_source = None
+
+    # Serializes audit log cache refreshes, so there is at most one download
+    _audit_log_lock = threading.RLock()
+
+    # Cache diagnostics (memory or disk hit vs. fresh download)
+    cache_hits = 0
+    cache_misses = 0
+
     def __init__(self):
         """Initialize audit client."""
         self.config = load_config()
-        self._audit_log_cache = None
-        self._audit_log_cache_time = None
         self._cache_ttl = 300  # 5 minute cache for audit log
+        self._session = None  # Keep-alive session, created on first request
+        # Set to False once fileop is refused or unreachable, to skip retries
+        self._fileop_audit_available = None
+        # Background audit log download for parallel lookups, at most one at a time
+        self._prefetch: Optional[threading.Thread] = None
+        self._prefetch_lock = threading.Lock()
+        # (monotonic time, error) of the last Splunk auth/connection failure
+        self._splunk_error: Optional[Tuple[float, Dict]] = None
+        self._splunk_error_ttl = 60
+        # Index/sourcetype part of every Splunk search, fixed by config
+        splunk_config = self.config.get("splunk", {})
+        sourcetype = splunk_config.get("sourcetype", "")
+        st_filter = f' sourcetype="{sourcetype}"' if sourcetype else ""
+        self._splunk_search_prefix = f'search index="{splunk_config.get("index", "")}"{st_filter}'
+        # Splunk request headers/auth, also fixed by config (token wins)
+        self._splunk_headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        self._splunk_auth: Optional[Tuple[str, str]] = None
+        token = splunk_config.get("token", "")
+        username = splunk_config.get("username", "")
+        password = decode_password(splunk_config.get("password", "")) if not token else ""
+        if token:
+            self._splunk_headers["Authorization"] = f"Bearer {token}"
+        elif username and password:
+            self._splunk_auth = (username, password)
 
     def get_object_audit(
         self,
         object_ref: str,
         object_type: str = None,
         object_name: str = None,
-        max_results: int = 10
+        max_results: int = 10,
+        parallel: bool = False
     ) -> Dict[str, Any]:
         """
         Get audit information for an object.
@@ -53,18 +253,16 @@ class AuditClient:
             object_ref: The _ref of the object (used to extract search term)
             object_type: Object type (network, zone, etc.)
             object_name: Object name/identifier for searching
+            parallel: Start downloading the fileop audit log alongside Splunk
+                instead of after it fails (Splunk results still win)
 
         Returns:
             Dict with audit information
         """
-        audit_info = {
-            "splunk_audit": [],
-            "fileop_audit": [],
-            "timestamps": {},
-            "created_by": None,
-            "last_modified_by": None,
-            "source": "none"
-        }
+        key = (object_ref, object_type, object_name, max_results)
+        cached = self._get_cached_audit_info(key)
+        if cached is not None:
+            return cached
 
         # Determine search term
         search_term = object_name
@@ -72,19 +270,151 @@ class AuditClient:
             search_term = self._extract_search_term(object_ref)
 
         if not search_term:
+            audit_info = _empty_audit_info()
             audit_info["message"] = "No search term available for audit lookup"
             return audit_info
 
-        # Try Splunk first if configured
+        # Nothing to ask: answer without touching either source
+        if not self.is_available():
+            audit_info = _empty_audit_info()
+            audit_info["message"] = "Splunk not configured. WAPI audit log empty or unavailable."
+            return audit_info
+
+        audit_info = self._audit_for_term(search_term, object_type, max_results, parallel)
+        self._cache_audit_info(key, audit_info)
+        return audit_info
+
+    def get_audit_for_objects(
+        self,
+        items: List[Tuple[str, Optional[str], Optional[str]]],
+        max_results: int = 10,
+        parallel: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get audit information for several objects.
+
+        The audit log archive is downloaded at most once for the whole
+        batch (it is cached on this client), so fileop lookups cost one
+        round-trip instead of one per object. With Splunk enabled, the
+        objects are looked up with one OR'd search per object type.
+
+        Args:
+            items: List of (object_ref, object_type, object_name) tuples
+            max_results: Max audit entries per object
+            parallel: Query Splunk and fileop concurrently (see get_object_audit)
+
+        Returns:
+            List of audit information dicts, in the same order as items
+        """
+        if parallel and self.config.get("splunk", {}).get("enabled"):
+            # One archive download for the whole batch, not one per object
+            self._prefetch_audit_log()
+
+        if not self.config.get("splunk", {}).get("enabled") or len(items) < 2:
+            return [
+                self.get_object_audit(object_ref, object_type, object_name, max_results, parallel)
+                for object_ref, object_type, object_name in items
+            ]
+
+        # Only look up objects without a recent result
+        results = [self._get_cached_audit_info((*item, max_results)) for item in items]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if len(pending) < 2:
+            for i in pending:
+                results[i] = self.get_object_audit(*items[i], max_results, parallel)
+            return results
+        pending_items = [items[i] for i in pending]
+
+        terms = [
+            object_name or self._extract_search_term(object_ref)
+            for object_ref, object_type, object_name in pending_items
+        ]
+
+        # One Splunk search per object type instead of one per object
+        splunk_by_type: Dict[Optional[str], Dict[str, Optional[List[Dict]]]] = {}
+        for (_, object_type, _), term in zip(pending_items, terms):
+            if term:
+                splunk_by_type.setdefault(object_type, {})[term] = None
+        for object_type, type_terms in splunk_by_type.items():
+            type_terms.update(self._get_splunk_audit_batch(list(type_terms), object_type, max_results))
+
+        for i, item, term in zip(pending, pending_items, terms):
+            if not term:
+                results[i] = self.get_object_audit(*item, max_results, parallel)
+                continue
+            object_type = item[1]
+            results[i] = self._audit_for_term(
+                term, object_type, max_results, parallel,
+                splunk_results=splunk_by_type[object_type][term]
+            )
+            self._cache_audit_info((*item, max_results), results[i])
+        return results
+
+    def is_available(self) -> bool:
+        """True if Splunk is enabled or WAPI fileop audit may still work."""
+        if self.config.get("splunk", {}).get("enabled"):
+            return True
+        if not self.config.get("infoblox", {}).get("fileop_audit", True):
+            return False
+        return self._fileop_audit_available is not False
+
+    def _get_cached_audit_info(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Copy of a lookup result from the last _audit_info_ttl seconds, if any."""
+        cached = self._audit_info_cache.get(key)
+        if cached is None:
+            return None
+        stored_at, audit_info = cached
+        if time.monotonic() - stored_at >= self._audit_info_ttl:
+            self._audit_info_cache.pop(key, None)
+            return None
+        self._audit_info_cache.move_to_end(key)
+        return copy.deepcopy(audit_info)
+
+    def _cache_audit_info(self, key: Tuple, audit_info: Dict[str, Any]):
+        """Remember a lookup result (a copy, so callers may modify theirs)."""
+        cache = type(self)._audit_info_cache
+        cache[key] = (time.monotonic(), copy.deepcopy(audit_info))
+        cache.move_to_end(key)
+        while len(cache) > self._audit_info_max:
+            cache.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, object_ref: str = None):
+        """Drop cached lookup results for object_ref, or all of them."""
+        if object_ref is None:
+            cls._audit_info_cache.clear()
+            return
+        for key in [key for key in cls._audit_info_cache if key[0] == object_ref]:
+            del cls._audit_info_cache[key]
+
+    def _audit_for_term(
+        self,
+        search_term: str,
+        object_type: Optional[str],
+        max_results: int,
+        parallel: bool = False,
+        splunk_results: Optional[List[Dict]] = None
+    ) -> Dict[str, Any]:
+        """
+        Look up audit information for one search term (Splunk, then fileop).
+
+        splunk_results, when given, are this term's share of a batched
+        Splunk search and replace the per-object Splunk query.
+        """
+        audit_info = _empty_audit_info()
         splunk_config = self.config.get("splunk", {})
+
+        # Optionally have the fallback's download in flight while Splunk answers
+        if parallel and splunk_config.get("enabled"):
+            self._prefetch_audit_log()
+
+        # Try Splunk first if configured
         if splunk_config.get("enabled"):
-            splunk_results = self._get_splunk_audit(search_term, object_type, max_results)
+            if splunk_results is None:
+                splunk_results = self._get_splunk_audit(search_term, object_type, max_results)
 
             # Check if Splunk returned valid results (not just errors)
-            has_valid_splunk = (
-                splunk_results and
-                not (len(splunk_results) == 1 and splunk_results[0].get("error"))
-            )
+            has_valid_splunk = splunk_results and not _is_error_result(splunk_results)
 
             if has_valid_splunk:
                 audit_info["splunk_audit"] = splunk_results
@@ -96,7 +426,7 @@ class AuditClient:
                 if splunk_results and splunk_results[0].get("error"):
                     audit_info["splunk_error"] = splunk_results[0]["error"]
 
-        # Fall back to WAPI fileop
+        # Fall back to WAPI fileop (waits for a prefetch still downloading)
         fileop_results = self._get_fileop_audit(search_term, object_type, max_results)
 
         if fileop_results:
@@ -117,17 +447,7 @@ class AuditClient:
         """Extract searchable term from object reference."""
         if not object_ref:
             return None
-
-        parts = object_ref.split(":")
-        if len(parts) > 1:
-            ref_data = parts[1]
-            # Handle network CIDR (e.g., 10.0.0.0/8/default -> 10.0.0.0/8)
-            if "/" in ref_data:
-                segments = ref_data.split("/")
-                if len(segments) >= 2:
-                    return f"{segments[0]}/{segments[1]}"
-            return ref_data.split("/")[0]
-        return None
+        return _search_term_from_ref(object_ref)
 
     def _extract_audit_metadata(
         self,
@@ -142,42 +462,28 @@ class AuditClient:
         if isinstance(audit_results[0], dict) and audit_results[0].get("error"):
             return
 
-        # Sort by timestamp to find first (created) and last (modified)
-        sorted_results = []
+        # One pass for the earliest (created) and latest (modified) entries;
+        # ties keep the first earliest and the last latest, as a stable sort would
+        first_ts = last_ts = first_entry = last_entry = None
         for entry in audit_results:
-            ts = (
-                entry.get("_time") or
-                entry.get("timestamp") or
-                entry.get("_indextime") or
-                entry.get("time")
-            )
-            if ts:
-                sorted_results.append((ts, entry))
+            ts = _entry_timestamp(entry)
+            if not ts:
+                continue
+            if first_entry is None or ts < first_ts:
+                first_ts, first_entry = ts, entry
+            if last_entry is None or ts >= last_ts:
+                last_ts, last_entry = ts, entry
 
-        if not sorted_results:
+        if first_entry is None:
             return
 
-        sorted_results.sort(key=lambda x: x[0])
-
         # First entry = creation
-        first_ts, first_entry = sorted_results[0]
         audit_info["timestamps"]["created"] = first_ts
-        audit_info["created_by"] = (
-            first_entry.get("admin") or
-            first_entry.get("user") or
-            first_entry.get("src_user") or
-            first_entry.get("Admin")
-        )
+        audit_info["created_by"] = _entry_user(first_entry)
 
         # Last entry = most recent modification
-        last_ts, last_entry = sorted_results[-1]
         audit_info["timestamps"]["last_modified"] = last_ts
-        audit_info["last_modified_by"] = (
-            last_entry.get("admin") or
-            last_entry.get("user") or
-            last_entry.get("src_user") or
-            last_entry.get("Admin")
-        )
+        audit_info["last_modified_by"] = _entry_user(last_entry)
 
     # =========================================================================
     # Splunk Methods
@@ -195,133 +501,189 @@ class AuditClient:
         Searches the configured Splunk index for InfoBlox audit events.
         Supports both token-based and username/password authentication.
         """
+        results = self._splunk_search(f'("{object_name}")', object_type, max_results)
+        if _is_error_result(results):
+            return results
+        return [self._normalize_splunk_result(result) for result in results]
+
+    def _get_splunk_audit_batch(
+        self,
+        terms: List[str],
+        object_type: str = None,
+        max_results: int = 20
+    ) -> Dict[str, Optional[List[Dict]]]:
+        """
+        Get Splunk audit entries for several search terms with one search.
+
+        Results are split back out by object_name, or failing that by
+        which terms the event text mentions as a whole name.
+        When the combined limit cut the search short, terms left with
+        fewer than max_results entries map to None, meaning they need
+        a search of their own.
+        """
+        limit = max_results * len(terms)
+        term_filter = "(" + " OR ".join(f'"{term}"' for term in terms) + ")"
+        # _raw is needed to tell which object each event belongs to
+        results = self._splunk_search(term_filter, object_type, limit, include_raw=True)
+        if _is_error_result(results):
+            return {term: [dict(results[0])] for term in terms}
+
+        by_term: Dict[str, Optional[List[Dict]]] = {term: [] for term in terms}
+        by_name = {term.lower(): term for term in terms}
+        # Whole-name matches only, so "fo1" does not pick up "fo10" events
+        patterns = [
+            (term, re.compile(r'(?<![\w.-])' + re.escape(term) + r'(?![\w.-])', re.IGNORECASE))
+            for term in terms
+        ]
+        for result in results:
+            object_name = str(result.get("object_name") or "").strip().lower()
+            if object_name in by_name:
+                matched = [by_name[object_name]]
+            else:
+                text = " ".join(str(result.get(field) or "") for field in ("message", "_raw"))
+                matched = [term for term, pattern in patterns if pattern.search(text)]
+            for term in matched:
+                matches = by_term[term]
+                if len(matches) < max_results:
+                    matches.append(self._normalize_splunk_result(result))
+
+        if len(results) >= limit:
+            for term in terms:
+                if len(by_term[term]) < max_results:
+                    by_term[term] = None
+        return by_term
+
+    def _splunk_search(
+        self,
+        term_filter: str,
+        object_type: Optional[str],
+        max_results: int,
+        include_raw: bool = False
+    ) -> List[Dict]:
+        """
+        Run a Splunk export search and return its raw result rows.
+
+        Args:
+            include_raw: Also return each event's full _raw text
+
+        Returns:
+            Newest-first result dicts, or a single {"error": ...} dict
+        """
         splunk_config = self.config.get("splunk", {})
 
         if not splunk_config.get("enabled"):
             return []
 
         host = splunk_config.get("host", "")
-        token = splunk_config.get("token", "")
-        username = splunk_config.get("username", "")
-        password = decode_password(splunk_config.get("password", ""))
         index = splunk_config.get("index", "")
-        sourcetype = splunk_config.get("sourcetype", "")
-
-        # Check authentication - need either token OR username/password
-        has_token = bool(token)
-        has_userpass = bool(username and password)
 
         if not host:
             return [{"error": "Splunk host not configured"}]
 
-        if not has_token and not has_userpass:
+        # Check authentication - need either token OR username/password
+        if "Authorization" not in self._splunk_headers and self._splunk_auth is None:
             return [{"error": "Splunk not fully configured (need token OR username/password)"}]
 
         if not index:
             return [{"error": "Splunk index not configured"}]
 
-        try:
-            # Build Splunk search query
-            search_parts = [f'search index="{index}"']
-
-            if sourcetype:
-                search_parts.append(f'sourcetype="{sourcetype}"')
-
-            # Search for object name
-            object_search = f'("{object_name}")'
-            search_parts.append(object_search)
-
-            # Add object type filter if provided
-            if object_type:
-                type_filter = f'(object_type="{object_type}" OR object_type="{object_type.upper()}" OR object_type="{object_type.lower()}")'
-                search_parts.append(type_filter)
+        # Don't wait on a host that just refused us or was unreachable
+        if self._splunk_error is not None:
+            failed_at, error = self._splunk_error
+            if time.monotonic() - failed_at < self._splunk_error_ttl:
+                return [dict(error)]
+            self._splunk_error = None
 
-            search_query = " ".join(search_parts)
-            search_query += f" | sort -_time | head {max_results}"
-            search_query += ' | table _time, admin, user, src_user, action, object_type, object_name, message, src, dest, _raw'
+        try:
+            # Build Splunk search query: index/sourcetype, object name, optional type filter
+            type_filter = (
+                f' (object_type="{object_type}" OR object_type="{object_type.upper()}"'
+                f' OR object_type="{object_type.lower()}")'
+            ) if object_type else ""
+            search_query = (
+                f'{self._splunk_search_prefix} {term_filter}{type_filter}'
+                f' | sort -_time | head {max_results}{_SPLUNK_TABLE}'
+                f'{", _raw" if include_raw else ""}'
+            )
 
             # Splunk REST API endpoint
             url = f"https://{host}/services/search/jobs/export"
 
-            # Set up authentication
-            headers = {"Content-Type": "application/x-www-form-urlencoded"}
-            auth = None
-
-            if has_token:
-                # Token-based authentication
-                headers["Authorization"] = f"Bearer {token}"
-            else:
-                # Username/password basic authentication
-                auth = (username, password)
+            data = {"search": search_query, **_SPLUNK_EXPORT_PARAMS}
 
-            data = {
-                "search": search_query,
-                "output_mode": "json",
-                "earliest_time": "-90d",
-                "latest_time": "now"
-            }
-
-            response = requests.post(
+            # Stream the export - results are parsed as lines arrive.
+            # Fail fast on connect, but give the search itself time to run.
+            response = self._get_session().post(
                 url,
-                headers=headers,
-                auth=auth,
+                headers=self._splunk_headers,
+                auth=self._splunk_auth,
                 data=data,
-                verify=False,
-                timeout=30
+                timeout=(5, 30),
+                stream=True
             )
 
-            if response.status_code == 200:
-                results = []
-                for line in response.text.strip().split("\n"):
-                    if line:
-                        try:
-                            event = json.loads(line)
-                            if "result" in event:
-                                result = event["result"]
-                                normalized = self._normalize_splunk_result(result)
-                                results.append(normalized)
-                        except json.JSONDecodeError:
-                            pass
-                return results
-            elif response.status_code == 401:
-                return [{"error": "Splunk authentication failed. Check your credentials."}]
-            elif response.status_code == 403:
-                return [{"error": "Splunk access denied. Check token permissions."}]
-            else:
-                return [{"error": f"Splunk query failed: HTTP {response.status_code}"}]
+            try:
+                if response.status_code == 200:
+                    # requests asks for gzip by default and inflates it while streaming
+                    logger.debug(
+                        f"Splunk export streaming (Content-Encoding: "
+                        f"{response.headers.get('Content-Encoding', 'identity')})"
+                    )
+                    results = []
+                    for line in response.iter_lines(chunk_size=65536):
+                        if not line:
+                            continue
+                        result = _parse_splunk_line(line)
+                        if result is not None:
+                            results.append(result)
+                            if len(results) >= max_results:
+                                break
+                    return results
+                elif response.status_code == 401:
+                    return self._splunk_failed("Splunk authentication failed. Check your credentials.")
+                elif response.status_code == 403:
+                    return self._splunk_failed("Splunk access denied. Check token permissions.")
+                else:
+                    return [{"error": f"Splunk query failed: HTTP {response.status_code}"}]
+            finally:
+                response.close()
 
         except requests.exceptions.ConnectionError:
-            return [{"error": f"Cannot connect to Splunk at {host}"}]
+            return self._splunk_failed(f"Cannot connect to Splunk at {host}")
         except requests.exceptions.Timeout:
-            return [{"error": "Splunk query timed out"}]
+            return self._splunk_failed("Splunk query timed out")
         except Exception as e:
             return [{"error": f"Splunk query error: {str(e)}"}]
 
+    def _splunk_failed(self, message: str) -> List[Dict]:
+        """Remember a host-level Splunk failure briefly and return it as a result."""
+        error = {"error": message}
+        self._splunk_error = (time.monotonic(), error)
+        return [dict(error)]
+
+    def _get_session(self) -> requests.Session:
+        """Get the pooled session used for Splunk and fileop requests."""
+        if self._session is None:
+            self._session = _new_session()
+        return self._session
+
     def _normalize_splunk_result(self, result: Dict) -> Dict:
         """Normalize Splunk result fields for consistent output."""
         normalized = {
             "timestamp": result.get("_time", ""),
-            "admin": (
-                result.get("admin") or
-                result.get("user") or
-                result.get("src_user") or
-                result.get("Admin") or
-                "unknown"
-            ),
+            "admin": _first_present(result, _USER_KEYS) or "unknown",
             "action": result.get("action", ""),
             "object_type": result.get("object_type", ""),
             "object_name": result.get("object_name", ""),
-            "message": result.get("message") or result.get("_raw", ""),
+            "message": _first_present(result, _MESSAGE_KEYS, ""),
             "source": result.get("src", ""),
             "destination": result.get("dest", "")
         }
 
-        if normalized["timestamp"]:
-            try:
-                ts = datetime.fromisoformat(normalized["timestamp"].replace("Z", "+00:00"))
-                normalized["timestamp_formatted"] = ts.strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, AttributeError):
-                normalized["timestamp_formatted"] = normalized["timestamp"]
+        timestamp = normalized["timestamp"]
+        if timestamp:
+            formatted = _format_iso_timestamp(timestamp) if isinstance(timestamp, str) else None
+            normalized["timestamp_formatted"] = formatted or timestamp
 
         return normalized
 
@@ -341,6 +703,12 @@ class AuditClient:
         Downloads the audit log archive from InfoBlox and searches for
         entries matching the object name.
         """
+        # Skip entirely when disabled in config or already known unavailable
+        if not self.config.get("infoblox", {}).get("fileop_audit", True):
+            return []
+        if self._fileop_audit_available is False:
+            return []
+
         try:
             # Get or refresh audit log cache
             audit_entries = self._get_cached_audit_log()
@@ -348,25 +716,31 @@ class AuditClient:
             if not audit_entries:
                 return []
 
-            # Filter entries by object name
+            # Filter entries by object name, checking only the entries the
+            # token index says may contain it (same result as a full scan)
             matching_entries = []
-            search_pattern = re.compile(re.escape(object_name), re.IGNORECASE)
-
-            for entry in audit_entries:
-                # Search in various fields
-                searchable_text = " ".join([
-                    str(entry.get("message", "")),
-                    str(entry.get("object_name", "")),
-                    str(entry.get("object", "")),
-                    str(entry.get("raw", ""))
-                ])
-
-                if search_pattern.search(searchable_text):
+            needle = object_name.lower()
+
+            candidates = self._token_candidates(audit_entries, object_name)
+            if candidates is None:
+                entries_to_check = audit_entries
+            else:
+                entries_to_check = (audit_entries[i] for i in candidates)
+
+            for entry in entries_to_check:
+                # Case-insensitive substring match in the text fields
+                if (needle in (entry.get("message") or "").lower()
+                        or needle in (entry.get("object_name") or "").lower()
+                        or needle in (entry.get("object") or "").lower()
+                        or needle in (entry.get("raw") or "").lower()):
                     # Optionally filter by object type
                     if object_type:
-                        entry_type = entry.get("object_type", "").upper()
+                        entry_type = (entry.get("object_type") or "").upper()
                         if object_type.upper() not in entry_type:
                             continue
+                    # Hand out plain dicts; the cache keeps the slotted entries
+                    if isinstance(entry, AuditEntry):
+                        entry = entry.as_dict()
                     matching_entries.append(entry)
 
                     if len(matching_entries) >= max_results:
@@ -377,110 +751,274 @@ class AuditClient:
         except Exception as e:
             return [{"error": f"WAPI fileop audit error: {str(e)}"}]
 
-    def _get_cached_audit_log(self) -> List[Dict]:
-        """Get audit log entries, using cache if available."""
-        now = datetime.now()
+    def _token_candidates(self, audit_entries: List[Dict], object_name: str) -> Optional[List[int]]:
+        """
+        Indexes of entries that may contain object_name, in log order, or
+        None when the name has nothing to index on and every entry must be
+        checked.
+
+        Each separator-free part of the name lies inside a single token
+        wherever the name occurs, so entries with a token containing the
+        name's longest part are a superset of the substring matches
+        (web01 is found in web01.example.com, example.com in "example.com.").
+        """
+        cls = type(self)
+        if cls._token_index_source is not audit_entries:
+            cls._token_index = _build_token_index(audit_entries)
+            cls._token_index_source = audit_entries
+
+        parts = [part for part in _TOKEN_SPLIT_RE.split(object_name.lower()) if part]
+        if not parts:
+            return None
+        longest = max(parts, key=len)
 
-        # Check if cache is valid
-        if (self._audit_log_cache is not None and
-            self._audit_log_cache_time is not None and
-            (now - self._audit_log_cache_time).total_seconds() < self._cache_ttl):
-            return self._audit_log_cache
+        hits = set()
+        for token, indexes in cls._token_index.items():
+            if longest in token:
+                hits.update(indexes)
+        return sorted(hits)
 
-        # Download fresh audit log
-        audit_entries = self._download_audit_log()
+    def _prefetch_audit_log(self) -> Optional[threading.Thread]:
+        """
+        Start downloading the audit log in the background.
 
-        # Update cache
-        self._audit_log_cache = audit_entries
-        self._audit_log_cache_time = now
+        Does nothing when fileop audit is off, the memory or disk cache is
+        already fresh, or this client's prefetch is still running. The
+        thread is a daemon so a CLI run that never needs the fallback does
+        not wait for it at exit.
+        """
+        if not self.config.get("infoblox", {}).get("fileop_audit", True):
+            return None
+        if self._fileop_audit_available is False:
+            return None
+        with self._prefetch_lock:
+            if self._prefetch is not None and self._prefetch.is_alive():
+                return self._prefetch
+            if self._audit_log_fresh():
+                return None
+            self._prefetch = threading.Thread(
+                target=self._prefetch_worker, name="ddi-audit-prefetch", daemon=True
+            )
+            self._prefetch.start()
+            return self._prefetch
 
-        return audit_entries
+    def _prefetch_worker(self):
+        """Warm the audit log cache; errors surface on the real lookup."""
+        try:
+            self._get_cached_audit_log()
+        except Exception as e:
+            logger.debug(f"Audit log prefetch failed: {e}")
 
-    def _download_audit_log(self) -> List[Dict]:
-        """Download and parse audit log from InfoBlox via WAPI fileop."""
+    def _audit_log_fresh(self) -> bool:
+        """True if the memory or disk cache can serve the audit log."""
+        if (self._audit_log_cache is not None and
+                self._audit_log_cache_time is not None and
+                (datetime.now() - self._audit_log_cache_time).total_seconds() < self._cache_ttl):
+            return True
+        path = self._disk_cache_path()
         try:
-            gm, user, pw, ver, ssl_verify, timeout = get_infoblox_creds()
-            base_url = f"https://{gm}/wapi/v{ver}"
-            auth = (user, pw)
-
-            # Step 1: Request the audit log download
-            resp = requests.post(
-                f"{base_url}/fileop",
-                auth=auth,
-                params={"_function": "get_log_files"},
-                json={
-                    "log_type": "AUDITLOG",
-                    "node_type": "ACTIVE"
-                },
-                verify=False,
-                timeout=timeout
-            )
+            return path is not None and time.time() - path.stat().st_mtime < self._cache_ttl
+        except OSError:
+            return False
+
+    def _get_cached_audit_log(self) -> List[AuditEntry]:
+        """Get audit log entries, using the memory or disk cache if valid."""
+        # One refresh at a time; a caller arriving mid-download gets its result
+        with self._audit_log_lock:
+            cls = type(self)
+            now = datetime.now()
+
+            # Check if cache is valid
+            if (self._audit_log_cache is not None and
+                self._audit_log_cache_time is not None and
+                (now - self._audit_log_cache_time).total_seconds() < self._cache_ttl):
+                cls.cache_hits += 1
+                return self._audit_log_cache
+
+            # Another process may have downloaded it recently
+            cached = self._load_disk_cache()
+            if cached is not None:
+                cls.cache_hits += 1
+                entries, cached_at = cached
+                cls._audit_log_cache = entries
+                cls._audit_log_cache_time = cached_at
+                return entries
+
+            # Download fresh audit log
+            cls.cache_misses += 1
+            audit_entries = self._download_audit_log()
+
+            # Update cache
+            cls._audit_log_cache = audit_entries
+            cls._audit_log_cache_time = now
+            if audit_entries:
+                self._save_disk_cache(audit_entries)
+
+            return audit_entries
+
+    def _disk_cache_path(self) -> Optional[Path]:
+        """Cache file for the configured grid master (None if not configured)."""
+        gm = self.config.get("infoblox", {}).get("grid_master", "")
+        if not gm:
+            return None
+        safe_gm = re.sub(r'[^A-Za-z0-9_.-]', '_', gm)
+        return AUDIT_CACHE_DIR / f"ddi_audit_{safe_gm}.json"
 
-            if resp.status_code != 200:
-                logger.debug(f"Audit log fileop request failed: HTTP {resp.status_code}")
-                return []
+    def _load_disk_cache(self) -> Optional[Tuple[List[AuditEntry], datetime]]:
+        """Load parsed entries from disk if the file is fresh and ours."""
+        path = self._disk_cache_path()
+        if path is None:
+            return None
+        try:
+            st = path.stat()
+            if hasattr(os, "getuid") and st.st_uid != os.getuid():
+                return None
+            if time.time() - st.st_mtime >= self._cache_ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            if not isinstance(entries, list):
+                return None
+            entries = [AuditEntry.from_dict(entry) for entry in entries]
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+        return entries, datetime.fromtimestamp(st.st_mtime)
 
-            data = resp.json()
-            download_url = data.get("url")
-            token = data.get("token", "").replace("\n", "")
+    def _save_disk_cache(self, entries: List[AuditEntry]):
+        """Write parsed entries to disk atomically, readable only by us."""
+        path = self._disk_cache_path()
+        if path is None:
+            return
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump([
+                    entry.as_dict() if isinstance(entry, AuditEntry) else entry
+                    for entry in entries
+                ], f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write audit cache {path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def _fetch_auditlog_archive(self) -> requests.Response:
+        """
+        Request the audit log via WAPI fileop and open the archive download.
 
-            if not download_url:
-                logger.debug("Audit log fileop returned no download URL")
-                return []
+        Returns:
+            The streamed download response; the caller reads .raw and closes it
 
-            # Step 2: Download the archive using POST
-            headers = {
-                "Accept": "application/octet-stream, application/x-gzip, */*",
-                "Content-Type": "application/json"
-            }
-            cookies = {"ibapauth": token}
-
-            download_resp = requests.post(
-                download_url,
-                auth=auth,
-                headers=headers,
-                cookies=cookies,
-                verify=False,
-                timeout=60
-            )
+        Raises:
+            WAPIError: If either request fails or no download URL is returned
+        """
+        gm, user, pw, ver, ssl_verify, timeout = get_infoblox_creds()
+        base_url = f"https://{gm}/wapi/v{ver}"
+        auth = (user, pw)
 
-            if download_resp.status_code != 200:
-                logger.debug(f"Audit log download failed: HTTP {download_resp.status_code}")
-                return []
+        # Step 1: Request the audit log download
+        session = self._get_session()
+        resp = session.post(
+            f"{base_url}/fileop",
+            auth=auth,
+            params={"_function": "get_log_files"},
+            json={
+                "log_type": "AUDITLOG",
+                "node_type": "ACTIVE"
+            },
+            timeout=timeout
+        )
 
-            if len(download_resp.content) == 0:
-                logger.debug("Audit log archive is empty")
+        if resp.status_code != 200:
+            raise WAPIError(f"Failed to initiate download: HTTP {resp.status_code}", resp.status_code)
+
+        data = resp.json()
+        download_url = data.get("url")
+        token = data.get("token", "").replace("\n", "")
+
+        if not download_url:
+            raise WAPIError("No download URL returned")
+
+        # Step 2: Download the archive using POST
+        headers = {
+            "Accept": "application/octet-stream, application/x-gzip, */*",
+            "Content-Type": "application/json"
+        }
+        cookies = {"ibapauth": token}
+
+        download_resp = session.post(
+            download_url,
+            auth=auth,
+            headers=headers,
+            cookies=cookies,
+            timeout=60,
+            stream=True
+        )
+
+        if download_resp.status_code != 200:
+            download_resp.close()
+            raise WAPIError(f"Download failed: HTTP {download_resp.status_code}", download_resp.status_code)
+
+        return download_resp
+
+    def _download_audit_log(self) -> List[AuditEntry]:
+        """Download and parse audit log from InfoBlox via WAPI fileop."""
+        try:
+            try:
+                download_resp = self._fetch_auditlog_archive()
+            except WAPIError as e:
+                logger.debug(f"Audit log fileop: {e.message}")
+                if e.status_code in (401, 403):
+                    # No permission for get_log_files - don't ask again
+                    self._fileop_audit_available = False
                 return []
 
-            # Step 3: Extract and parse the audit log
-            return self._parse_audit_archive(download_resp.content)
+            try:
+                # Decompress and parse the archive as it arrives
+                raw = download_resp.raw
+                raw.decode_content = True
+                return self._parse_audit_archive(raw)
+            finally:
+                download_resp.close()
 
         except requests.exceptions.ConnectionError as e:
             logger.warning(f"Connection error downloading audit log: {e}")
+            self._fileop_audit_available = False
             return []
         except requests.exceptions.Timeout as e:
             logger.warning(f"Timeout downloading audit log: {e}")
+            self._fileop_audit_available = False
             return []
         except Exception as e:
             logger.warning(f"Error downloading audit log: {type(e).__name__}: {e}")
             return []
 
-    def _parse_audit_archive(self, archive_content: bytes) -> List[Dict]:
-        """Parse audit log entries from tar.gz archive."""
+    def _parse_audit_archive(self, archive: Union[bytes, BinaryIO]) -> List[AuditEntry]:
+        """
+        Parse audit log entries from a tar.gz archive.
+
+        Accepts the archive bytes or a readable stream; the tar is read in
+        pipe mode, so a stream is decompressed and parsed in one pass.
+        """
         entries = []
+        fileobj = io.BytesIO(archive) if isinstance(archive, (bytes, bytearray)) else archive
 
         try:
-            with tarfile.open(fileobj=io.BytesIO(archive_content), mode='r:gz') as tar:
-                for member in tar.getnames():
-                    if 'audit' in member.lower():
-                        try:
-                            f = tar.extractfile(member)
-                            if f:
-                                content = f.read().decode('utf-8', errors='ignore')
-                                entries.extend(self._parse_audit_log_content(content))
-                        except Exception as e:
-                            logger.debug(f"Error extracting {member} from audit archive: {e}")
-                            continue
+            with tarfile.open(fileobj=fileobj, mode='r|gz') as tar:
+                for member in tar:
+                    if not member.isfile() or 'audit' not in member.name.lower():
+                        continue
+                    try:
+                        f = tar.extractfile(member)
+                        if f:
+                            lines = (raw.decode('utf-8', errors='ignore') for raw in f)
+                            entries.extend(self._parse_audit_lines(lines))
+                    except Exception as e:
+                        logger.debug(f"Error extracting {member.name} from audit archive: {e}")
+                        continue
+        except tarfile.ReadError as e:
+            logger.debug(f"Audit archive is empty or not a tar.gz: {e}")
         except tarfile.TarError as e:
             logger.warning(f"Error opening audit archive as tar.gz: {e}")
         except Exception as e:
@@ -488,21 +1026,28 @@ class AuditClient:
 
         return entries
 
-    def _parse_audit_log_content(self, content: str) -> List[Dict]:
+    def _parse_audit_log_content(self, content: str) -> List[AuditEntry]:
         """Parse individual audit log entries from log file content."""
+        return self._parse_audit_lines(content.strip().split('\n'))
+
+    def _parse_audit_lines(self, lines: Iterable[str]) -> List[AuditEntry]:
+        """Parse audit log entries from an iterable of lines."""
         entries = []
+        parse_line = self._parse_audit_line
 
-        for line in content.strip().split('\n'):
+        for line in lines:
+            if line.endswith('\n'):
+                line = line[:-1]
             if not line.strip():
                 continue
 
-            entry = self._parse_audit_line(line)
+            entry = parse_line(line)
             if entry:
                 entries.append(entry)
 
         return entries
 
-    def _parse_audit_line(self, line: str) -> Optional[Dict]:
+    def _parse_audit_line(self, line: str) -> Optional[AuditEntry]:
         """
         Parse a single audit log line.
 
@@ -516,66 +1061,46 @@ class AuditClient:
         if not line.strip():
             return None
 
-        entry = {
-            "raw": line,
-            "timestamp": None,
-            "admin": None,
-            "action": None,
-            "object_type": None,
-            "object_name": None,
-            "message": line
-        }
+        timestamp = admin = action = object_type = None
 
-        # Try to extract timestamp (common formats)
-        # Format: 2024-01-15 10:30:00 or Jan 15 10:30:00 or ISO format
-        timestamp_patterns = [
-            r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})',  # ISO-like
-            r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})',      # Syslog format
-        ]
+        # Cheap literal checks first; most patterns need a marker to match at all
+        lowered = line.lower()
 
-        for pattern in timestamp_patterns:
-            match = re.search(pattern, line)
-            if match:
-                entry["timestamp"] = match.group(1)
-                break
+        # Try to extract timestamp (common formats)
+        if ':' in line:
+            for pattern in _TS_PATTERNS:
+                match = pattern.search(line)
+                if match:
+                    timestamp = match.group(1)
+                    break
 
         # Try to extract admin user
-        admin_patterns = [
-            r'admin[=:](\S+)',
-            r'user[=:](\S+)',
-            r'by\s+(\S+@\S+|\w+)',
-        ]
-
-        for pattern in admin_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                entry["admin"] = match.group(1)
-                break
-
-        # Try to extract action
-        action_patterns = [
-            r'\b(INSERT|UPDATE|DELETE|CREATE|MODIFY|REMOVE|ADD|CHANGE)\b',
-        ]
-
-        for pattern in action_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for marker, pattern in _ADMIN_PATTERNS:
+            if marker in lowered:
+                match = pattern.search(line)
+                if match:
+                    admin = match.group(1)
+                    break
+
+        # Explicit object_type=... wins over a bare type keyword
+        if "object_type" in lowered:
+            match = _OBJECT_TYPE_FIELD_RE.search(line)
             if match:
-                entry["action"] = match.group(1).upper()
+                object_type = match.group(1).upper()
+
+        # Single scan for the first action keyword and first type keyword
+        need_type = object_type is None
+        for word in _WORD_RE.findall(line.upper()):
+            if word in _ACTION_KEYWORDS:
+                if action is None:
+                    action = word
+            elif need_type and word in _TYPE_KEYWORDS:
+                object_type = word
+                need_type = False
+            if action is not None and not need_type:
                 break
 
-        # Try to extract object type
-        type_patterns = [
-            r'object_type[=:\s]+(\S+)',
-            r'\b(NETWORK|ZONE|HOST|RECORD|RANGE|FIXEDADDRESS|LEASE)\b',
-        ]
-
-        for pattern in type_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                entry["object_type"] = match.group(1).upper()
-                break
-
-        return entry
+        return AuditEntry(line, timestamp, admin, action, object_type)
 
 
 def get_audit_for_object(
@@ -598,8 +1123,146 @@ def get_audit_for_object(
     Returns:
         Audit information dict with source indicator
     """
-    client = AuditClient()
-    return client.get_object_audit(object_ref, object_type, object_name, max_results)
+    return get_audit_client().get_object_audit(object_ref, object_type, object_name, max_results)
+
+
+def get_audit_for_objects(
+    items: List[Tuple[str, Optional[str], Optional[str]]],
+    max_results: int = 10,
+    parallel: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Convenience function to get audit info for several objects at once.
+
+    Args:
+        items: List of (object_ref, object_type, object_name) tuples
+        max_results: Max audit entries per object
+        parallel: Query Splunk and fileop concurrently for each object
+
+    Returns:
+        List of audit information dicts, in the same order as items
+    """
+    return get_audit_client().get_audit_for_objects(items, max_results, parallel)
+
+
+# Singleton pattern so config and the audit log cache outlive a single lookup
+_audit_client: Optional[AuditClient] = None
+
+
+def get_audit_client() -> AuditClient:
+    """Get or create AuditClient singleton."""
+    global _audit_client
+    if _audit_client is None:
+        _audit_client = AuditClient()
+    return _audit_client
+
+
+def audit_available() -> bool:
+    """
+    Check whether audit lookups can return anything.
+
+    False when Splunk is disabled and WAPI fileop audit is turned off in
+    config or was refused earlier in this session; callers can then skip
+    gathering objects to look up.
+    """
+    return get_audit_client().is_available()
+
+
+def invalidate_audit_cache(object_ref: str = None):
+    """Forget recent audit lookups for an object (or all), e.g., after changing it."""
+    AuditClient.invalidate(object_ref)
+
+
+def reset_audit_client():
+    """Reset audit client and its in-memory audit log (e.g., after config change)."""
+    global _audit_client
+    _audit_client = None
+    AuditClient._audit_log_cache = None
+    AuditClient._audit_log_cache_time = None
+    AuditClient._token_index = {}
+    AuditClient._audit_info_cache.clear()
+    AuditClient._token_index_source = None
+
+
+@lru_cache(maxsize=4096)
+def _search_term_from_ref(object_ref: str) -> Optional[str]:
+    """Cached body of AuditClient._extract_search_term."""
+    parts = object_ref.split(":", 2)
+    if len(parts) > 1:
+        # Keep at most two segments, so a network CIDR survives
+        # (e.g., 10.0.0.0/8/default -> 10.0.0.0/8)
+        segments = parts[1].split("/", 2)
+        return "/".join(segments[:2])
+    return None
+
+
+def _is_error_result(results: List[Dict]) -> bool:
+    """True if a lookup returned a single error dict instead of results."""
+    return len(results) == 1 and bool(results[0].get("error"))
+
+
+def _empty_audit_info() -> Dict[str, Any]:
+    """Audit info dict with no results, filled in by the lookups."""
+    return {
+        "splunk_audit": [],
+        "fileop_audit": [],
+        "timestamps": {},
+        "created_by": None,
+        "last_modified_by": None,
+        "source": "none"
+    }
+
+
+# Fields that may carry each value, in order of preference
+_TIMESTAMP_KEYS = ("_time", "timestamp", "_indextime", "time")
+_USER_KEYS = ("admin", "user", "src_user", "Admin")
+_MESSAGE_KEYS = ("message", "_raw")
+
+
+def _first_present(entry: Dict, keys: Tuple[str, ...], default: Any = None) -> Any:
+    """First non-empty value among keys, else default."""
+    for key in keys:
+        value = entry.get(key)
+        if value:
+            return value
+    return default
+
+
+def _entry_timestamp(entry: Dict) -> Any:
+    """Timestamp of an audit entry, from whichever field the source uses."""
+    return _first_present(entry, _TIMESTAMP_KEYS)
+
+
+def _entry_user(entry: Dict) -> Optional[str]:
+    """Admin/user who made an audited change."""
+    return _first_present(entry, _USER_KEYS)
+
+
+def _parse_splunk_line(line) -> Optional[Dict]:
+    """
+    Parse one Splunk export line and return its "result" payload.
+
+    Uses simdjson when installed, materializing only the result object;
+    falls back to orjson, then the stdlib json module.
+
+    Returns:
+        The result dict, or None for malformed or non-result lines
+    """
+    if _simdjson_parser is not None:
+        try:
+            doc = _simdjson_parser.parse(line)
+        except ValueError:
+            return None
+        # The parser can only be reused once doc and its children are released
+        result = doc.get("result") if isinstance(doc, simdjson.Object) else None
+        return result.as_dict() if isinstance(result, simdjson.Object) else None
+
+    try:
+        event = _json_loads(line)
+    except ValueError:
+        return None
+    result = event.get("result") if isinstance(event, dict) else None
+    return result if isinstance(result, dict) else None
 
 
 def _parse_timestamp(timestamp_value: Any) -> str:
@@ -617,25 +1280,48 @@ def _parse_timestamp(timestamp_value: Any) -> str:
     if not timestamp_value:
         return "N/A"
 
-    ts_str = str(timestamp_value)
+    return _format_timestamp_str(str(timestamp_value))
 
-    # Try ISO format first (most common from Splunk)
+
+# Display format shared by every audit timestamp
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+# Audit batches repeat the same second-resolution timestamps a lot
+# (bulk imports), so memoize the datetime parse + strftime round-trip.
+@lru_cache(maxsize=1024)
+def _format_iso_timestamp(ts_str: str) -> Optional[str]:
+    """Format an ISO timestamp for display (None if unparseable)."""
     try:
-        # Handle ISO format with optional timezone
-        ts_clean = ts_str.replace("Z", "+00:00")
-        if "T" in ts_clean or "-" in ts_clean[:10]:
-            ts = datetime.fromisoformat(ts_clean)
-            return ts.strftime("%Y-%m-%d %H:%M:%S")
-    except (ValueError, TypeError):
-        pass
+        ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return ts.strftime(_TIMESTAMP_FORMAT)
 
-    # Try Unix timestamp (numeric)
+
+@lru_cache(maxsize=1024)
+def _fmt_ts(epoch: float) -> Optional[str]:
+    """Format a Unix timestamp for display (None if out of range)."""
     try:
-        if ts_str.isdigit() or (ts_str.replace(".", "").isdigit() and ts_str.count(".") <= 1):
-            ts = datetime.fromtimestamp(float(ts_str))
-            return ts.strftime("%Y-%m-%d %H:%M:%S")
-    except (ValueError, TypeError, OSError):
-        pass
+        return datetime.fromtimestamp(epoch).strftime(_TIMESTAMP_FORMAT)
+    except (ValueError, OSError, OverflowError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _format_timestamp_str(ts_str: str) -> str:
+    """Cached body of _parse_timestamp for string input."""
+    # Try ISO format first (most common from Splunk)
+    if "T" in ts_str or "-" in ts_str[:10]:
+        formatted = _format_iso_timestamp(ts_str)
+        if formatted:
+            return formatted
+
+    # Try Unix timestamp (numeric)
+    if ts_str.isdigit() or (ts_str.replace(".", "").isdigit() and ts_str.count(".") <= 1):
+        formatted = _fmt_ts(float(ts_str))
+        if formatted:
+            return formatted
 
     # Return as-is if already looks like a formatted date
     return ts_str
@@ -683,62 +1369,33 @@ def download_full_audit_log(output_path: str = None) -> Tuple[bool, str]:
         Tuple of (success, message_or_path)
     """
     try:
-        gm, user, pw, ver, ssl_verify, timeout = get_infoblox_creds()
-        base_url = f"https://{gm}/wapi/v{ver}"
-        auth = (user, pw)
-
-        # Request the audit log download
-        resp = requests.post(
-            f"{base_url}/fileop",
-            auth=auth,
-            params={"_function": "get_log_files"},
-            json={
-                "log_type": "AUDITLOG",
-                "node_type": "ACTIVE"
-            },
-            verify=False,
-            timeout=timeout
-        )
-
-        if resp.status_code != 200:
-            return False, f"Failed to initiate download: HTTP {resp.status_code}"
-
-        data = resp.json()
-        download_url = data.get("url")
-        token = data.get("token", "").replace("\n", "")
-
-        if not download_url:
-            return False, "No download URL returned"
-
-        # Download the archive
-        headers = {
-            "Accept": "application/octet-stream, application/x-gzip, */*",
-            "Content-Type": "application/json"
-        }
-        cookies = {"ibapauth": token}
-
-        download_resp = requests.post(
-            download_url,
-            auth=auth,
-            headers=headers,
-            cookies=cookies,
-            verify=False,
-            timeout=60
-        )
-
-        if download_resp.status_code != 200:
-            return False, f"Download failed: HTTP {download_resp.status_code}"
-
-        if len(download_resp.content) == 0:
-            return False, "Audit log is empty"
+        try:
+            download_resp = get_audit_client()._fetch_auditlog_archive()
+        except WAPIError as e:
+            return False, e.message
 
-        # Save to file if path provided
-        if output_path:
-            with open(output_path, 'wb') as f:
-                f.write(download_resp.content)
-            return True, output_path
-        else:
-            return True, f"Downloaded {len(download_resp.content)} bytes"
+        try:
+            raw = download_resp.raw
+            raw.decode_content = True
+
+            # Stream to file if path provided, otherwise just measure it
+            if output_path:
+                with open(output_path, 'wb') as f:
+                    shutil.copyfileobj(raw, f, length=1024 * 1024)
+                    size = f.tell()
+                if size == 0:
+                    os.remove(output_path)
+                    return False, "Audit log is empty"
+                return True, output_path
+
+            size = 0
+            for chunk in iter(lambda: raw.read(1024 * 1024), b""):
+                size += len(chunk)
+            if size == 0:
+                return False, "Audit log is empty"
+            return True, f"Downloaded {size} bytes"
+        finally:
+            download_resp.close()
 
     except Exception as e:
         return False, f"Error: {str(e)}"
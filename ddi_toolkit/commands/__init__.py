@@ -1,5 +1,9 @@
 """
-Command registry - Auto-discovers and loads command modules.
+Command registry - Loads command modules on first use.
+
+Built-in commands are listed below so that dispatching one command only
+imports its own module; any other module in this package is still picked
+up by auto-discovery.
 """
 
 import importlib
@@ -8,11 +12,66 @@ from pathlib import Path
 from typing import Dict, Type, Optional, List
 from .base import BaseCommand
 
-# Command registry
+# Built-in command name -> module, and alias -> command name
+_COMMAND_MODULES = {
+    "bulk": "bulk",
+    "container": "container",
+    "dhcp": "dhcp",
+    "ip": "ip",
+    "network": "network",
+    "search": "search",
+    "zone": "zone",
+}
+_COMMAND_ALIASES = {
+    "import": "bulk", "batch": "bulk",
+    "netcontainer": "container", "nc": "container",
+    "lease": "dhcp", "pool": "dhcp",
+    "ipv4": "ip", "address": "ip", "addr": "ip",
+    "net": "network", "subnet": "network",
+    "find": "search", "lookup": "search",
+    "dns": "zone", "domain": "zone",
+}
+
+# Command registry: command name -> class, and alias -> command name
 _commands: Dict[str, Type[BaseCommand]] = {}
+_aliases: Dict[str, str] = {}
 _discovered = False
 
 
+def _register(module) -> Optional[Type[BaseCommand]]:
+    """Register a module's command class under its name and aliases."""
+    if not hasattr(module, "command"):
+        return None
+
+    cmd_class = module.command
+    _commands[cmd_class.name] = cmd_class
+
+    # Register aliases
+    for alias in getattr(cmd_class, "aliases", []):
+        _aliases[alias] = cmd_class.name
+    return cmd_class
+
+
+def _lookup(name: str) -> Optional[Type[BaseCommand]]:
+    """Registered command class for a name or alias."""
+    return _commands.get(name) or _commands.get(_aliases.get(name))
+
+
+def _load_builtin(name: str) -> Optional[Type[BaseCommand]]:
+    """Import a built-in command's module by command name or alias."""
+    module_name = _COMMAND_MODULES.get(_COMMAND_ALIASES.get(name, name))
+    if module_name is None:
+        return None
+
+    try:
+        module = importlib.import_module(f".{module_name}", package=__name__)
+    except ImportError as e:
+        print(f"Warning: Failed to load command module {module_name}: {e}")
+        return None
+    _register(module)
+    return _lookup(name)
+
+
 def _discover_commands():
     """Auto-discover command modules in this package."""
     global _discovered
@@ -28,14 +87,7 @@ def _discover_commands():
 
         try:
             module = importlib.import_module(f".{module_name}", package=__name__)
-
-            if hasattr(module, "command"):
-                cmd_class = module.command
-                _commands[cmd_class.name] = cmd_class
-
-                # Register aliases
-                for alias in getattr(cmd_class, "aliases", []):
-                    _commands[alias] = cmd_class
+            _register(module)
         except ImportError as e:
             print(f"Warning: Failed to load command module {module_name}: {e}")
 
@@ -52,8 +104,13 @@ def get_command(name: str) -> Optional[Type[BaseCommand]]:
     Returns:
         Command class or None if not found
     """
-    _discover_commands()
-    return _commands.get(name)
+    cmd_class = _lookup(name)
+    if cmd_class is None:
+        cmd_class = _load_builtin(name)
+    if cmd_class is None and not _discovered:
+        _discover_commands()
+        cmd_class = _lookup(name)
+    return cmd_class
 
 
 def list_commands() -> Dict[str, str]:
@@ -64,28 +121,10 @@ def list_commands() -> Dict[str, str]:
         Dict mapping command names to descriptions
     """
     _discover_commands()
-
-    # Deduplicate (aliases point to same class)
-    seen = set()
-    result = {}
-
-    for name, cls in _commands.items():
-        if cls.name not in seen:
-            result[cls.name] = cls.description
-            seen.add(cls.name)
-
-    return result
+    return {name: cls.description for name, cls in _commands.items()}
 
 
 def get_command_names() -> List[str]:
     """Get list of all command names (excluding aliases)."""
     _discover_commands()
-    seen = set()
-    names = []
-
-    for name, cls in _commands.items():
-        if cls.name not in seen:
-            names.append(cls.name)
-            seen.add(cls.name)
-
-    return sorted(names)
+    return sorted(_commands)
@@ -2,14 +2,13 @@
 Base command class - All commands inherit from this.
 """
 
-from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from ..wapi import get_client, WAPIClient, WAPIError
 from ..output import OutputWriter
 
 
-class BaseCommand(ABC):
-    """Abstract base class for all DDI commands."""
+class BaseCommand:
+    """Base class for all DDI commands (subclasses implement execute)."""
 
     # Override in subclasses
     name: str = "base"
@@ -27,7 +26,6 @@ class BaseCommand(ABC):
             self._client = get_client()
         return self._client
 
-    @abstractmethod
     def execute(self, query: str, **kwargs) -> Dict[str, Any]:
         """
         Execute the command.
@@ -39,7 +37,7 @@ class BaseCommand(ABC):
         Returns:
             Dict containing the query results
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement execute()")
 
     def run(self, query: str, quiet: bool = False, **kwargs) -> Dict[str, Any]:
         """
@@ -3,6 +3,7 @@ Bulk operations command - Create, Modify, Delete objects from CSV/JSON files.
 """
 
 import csv
+import io
 import json
 import time
 from pathlib import Path
@@ -10,6 +11,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from .base import BaseCommand
 from ..wapi import WAPIError
+from ..audit import invalidate_audit_cache
 
 
 # Supported object types and their WAPI mappings
@@ -98,6 +100,7 @@ class BulkCommand(BaseCommand):
             query: Operation type ('create', 'modify', 'delete')
             object_type: Type of object (network, host, a, cname, etc.)
             file: Path to CSV or JSON file
+            file_obj: Already-open binary handle to read instead of ``file``
             dry_run: Preview changes without executing
             continue_on_error: Continue processing after errors
 
@@ -107,6 +110,7 @@ class BulkCommand(BaseCommand):
         operation = query.lower()
         object_type = kwargs.get("object_type", "").lower()
         file_path = kwargs.get("file")
+        file_obj = kwargs.get("file_obj")
         dry_run = kwargs.get("dry_run", False)
         continue_on_error = kwargs.get("continue_on_error", True)
 
@@ -125,14 +129,14 @@ class BulkCommand(BaseCommand):
             }
 
         # Validate file
-        if not file_path:
+        if not file_path and file_obj is None:
             return {
                 "error": "No file specified",
                 "hint": "Use --file to specify input CSV or JSON file"
             }
 
-        file_path = Path(file_path)
-        if not file_path.exists():
+        file_path = Path(file_path or getattr(file_obj, "name", ""))
+        if file_obj is None and not file_path.exists():
             return {
                 "error": f"File not found: {file_path}",
                 "hint": "Check the file path"
@@ -140,7 +144,7 @@ class BulkCommand(BaseCommand):
 
         # Load objects from file
         try:
-            objects = self._load_file(file_path)
+            objects = self._load_file(file_path, file_obj)
         except Exception as e:
             return {
                 "error": f"Failed to load file: {e}",
@@ -176,6 +180,10 @@ class BulkCommand(BaseCommand):
 
         elapsed_time = time.time() - start_time
 
+        # Audit lookups cached before this run no longer reflect the objects
+        if not dry_run and results["successful"]:
+            invalidate_audit_cache()
+
         # Build response
         response = {
             "operation": operation,
@@ -205,46 +213,53 @@ class BulkCommand(BaseCommand):
 
         return response
 
-    def _load_file(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Load objects from CSV or JSON file."""
+    def _load_file(self, file_path: Path, file_obj=None) -> List[Dict[str, Any]]:
+        """Load objects from CSV or JSON file (or an open binary handle)."""
         suffix = file_path.suffix.lower()
+        if suffix not in (".json", ".csv"):
+            raise ValueError(f"Unsupported file format: {suffix}. Use .json or .csv")
+
+        if file_obj is not None:
+            return self._parse_file(file_obj, suffix)
+        with open(file_path, 'rb', buffering=1 << 20) as f:
+            return self._parse_file(f, suffix)
 
+    def _parse_file(self, f, suffix: str) -> List[Dict[str, Any]]:
+        """Parse objects from a binary file handle."""
         if suffix == ".json":
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                # Handle both array and single object
-                if isinstance(data, list):
-                    return data
-                elif isinstance(data, dict):
-                    # Check if it's wrapped in a data key
-                    if "data" in data and isinstance(data["data"], list):
-                        return data["data"]
-                    return [data]
-                return []
-
-        elif suffix == ".csv":
-            objects = []
-            with open(file_path, 'r', newline='') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Clean up the row - remove empty values
-                    obj = {}
-                    for key, value in row.items():
-                        if value is not None and value.strip() != "":
-                            # Try to parse JSON for complex fields
-                            if value.startswith('[') or value.startswith('{'):
-                                try:
-                                    obj[key] = json.loads(value)
-                                except json.JSONDecodeError:
-                                    obj[key] = value
-                            else:
+            data = json.load(f)
+            # Handle both array and single object
+            if isinstance(data, list):
+                return data
+            elif isinstance(data, dict):
+                # Check if it's wrapped in a data key
+                if "data" in data and isinstance(data["data"], list):
+                    return data["data"]
+                return [data]
+            return []
+
+        objects = []
+        text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+        try:
+            for row in csv.DictReader(text):
+                # Clean up the row - remove empty values
+                obj = {}
+                for key, value in row.items():
+                    if value is not None and value.strip() != "":
+                        # Try to parse JSON for complex fields
+                        if value.startswith('[') or value.startswith('{'):
+                            try:
+                                obj[key] = json.loads(value)
+                            except json.JSONDecodeError:
                                 obj[key] = value
-                    if obj:
-                        objects.append(obj)
-            return objects
-
-        else:
-            raise ValueError(f"Unsupported file format: {suffix}. Use .json or .csv")
+                        else:
+                            obj[key] = value
+                if obj:
+                    objects.append(obj)
+        finally:
+            # Leave the caller's handle open
+            text.detach()
+        return objects
 
     def _validate_objects(
         self,
@@ -2,9 +2,11 @@
 DHCP query command.
 """
 
+from collections import Counter
+from datetime import datetime
 from typing import Dict, Any, List
 from .base import BaseCommand
-from ..audit import get_audit_for_object, format_audit_summary
+from ..audit import get_audit_for_objects, format_audit_summary
 
 
 class DHCPCommand(BaseCommand):
@@ -76,15 +78,14 @@ class DHCPCommand(BaseCommand):
 
         # Get audit info for each range (limited to first 5 for performance)
         if include_audit and ranges:
-            for i, rng in enumerate(ranges[:5]):
-                rng_ref = rng.get("_ref", "")
-                rng_name = f"{rng.get('start_addr', '')}-{rng.get('end_addr', '')}"
-                audit_info = get_audit_for_object(
-                    object_ref=rng_ref,
-                    object_type="RANGE",
-                    object_name=rng_name,
-                    max_results=3
-                )
+            audits = get_audit_for_objects(
+                [
+                    (rng.get("_ref", ""), "RANGE", f"{rng.get('start_addr', '')}-{rng.get('end_addr', '')}")
+                    for rng in ranges[:5]
+                ],
+                max_results=3
+            )
+            for i, audit_info in enumerate(audits):
                 ranges[i]["audit"] = {
                     "created": audit_info.get("timestamps", {}).get("created"),
                     "created_by": audit_info.get("created_by"),
@@ -142,21 +143,26 @@ class DHCPCommand(BaseCommand):
         )
 
         # Categorize by binding state
-        state_counts = {}
-        for lease in leases:
-            state = lease.get("binding_state", "unknown")
-            state_counts[state] = state_counts.get(state, 0) + 1
+        state_counts = dict(Counter(lease.get("binding_state", "unknown") for lease in leases))
 
-        # Format lease timestamps for readability
-        from datetime import datetime
+        # Format lease timestamps for readability; leases share a lot of
+        # timestamps (same start times, fixed lease lengths), so format each once
+        formatted = {}
         for lease in leases:
-            for field in ["starts", "ends", "tstp", "cltt"]:
+            additions = {}
+            for field in ("starts", "ends", "tstp", "cltt"):
                 if lease.get(field):
                     try:
-                        ts = datetime.fromtimestamp(int(lease[field]))
-                        lease[f"{field}_formatted"] = ts.strftime("%Y-%m-%d %H:%M:%S")
+                        epoch = int(lease[field])
+                        text = formatted.get(epoch)
+                        if text is None:
+                            text = datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S")
+                            formatted[epoch] = text
+                        additions[f"{field}_formatted"] = text
                     except (ValueError, TypeError, OSError, OverflowError):
                         pass
+            if additions:
+                lease.update(additions)
 
         result = {
             "query_type": "leases",
@@ -205,15 +211,11 @@ class DHCPCommand(BaseCommand):
 
         # Get audit info for each failover association
         if include_audit and failovers:
-            for i, fo in enumerate(failovers):
-                fo_ref = fo.get("_ref", "")
-                fo_name = fo.get("name", "")
-                audit_info = get_audit_for_object(
-                    object_ref=fo_ref,
-                    object_type="DHCPFAILOVER",
-                    object_name=fo_name,
-                    max_results=5
-                )
+            audits = get_audit_for_objects(
+                [(fo.get("_ref", ""), "DHCPFAILOVER", fo.get("name", "")) for fo in failovers],
+                max_results=5
+            )
+            for i, audit_info in enumerate(audits):
                 failovers[i]["audit"] = {
                     "created": audit_info.get("timestamps", {}).get("created"),
                     "created_by": audit_info.get("created_by"),
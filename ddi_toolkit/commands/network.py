@@ -2,7 +2,9 @@
 Network query command.
 """
 
-from typing import Dict, Any, List, Tuple
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from .base import BaseCommand
 from ..audit import get_audit_for_object, format_audit_summary
 
@@ -10,6 +12,23 @@ from ..audit import get_audit_for_object, format_audit_summary
 # Maximum IPs to fetch to prevent memory issues on large networks
 MAX_IP_FETCH = 10000
 
+# Characters to escape when matching literal names with a WAPI "~" regex
+# (re.escape also escapes "-", which POSIX regex does not require)
+_REGEX_SPECIAL = re.compile(r'([.^$*+?()\[\]{}|\\])')
+
+
+def _range_member_names(rng: Dict[str, Any]) -> Iterator[Optional[str]]:
+    """Yield the member and failover names serving a DHCP range (may yield None)."""
+    member = rng.get("member")
+    if isinstance(member, dict):
+        # Member could be struct with _struct field
+        yield member.get("name") or member.get("_struct")
+    elif isinstance(member, str):
+        yield member
+
+    # Also check failover association for servers
+    yield rng.get("failover_association")
+
 
 class NetworkCommand(BaseCommand):
     """Query network information including DHCP and utilization."""
@@ -24,6 +43,12 @@ class NetworkCommand(BaseCommand):
         "dhcp_utilization", "dynamic_hosts", "static_hosts"
     ]
 
+    # Fields behind the summary and counts, for detail=False
+    RETURN_FIELDS_MINIMAL = [
+        "network", "network_view", "comment", "utilization", "total_hosts",
+        "dhcp_utilization", "dynamic_hosts", "static_hosts"
+    ]
+
     # Core range fields supported across WAPI versions
     RANGE_RETURN_FIELDS = [
         "start_addr", "end_addr", "server_association_type",
@@ -31,6 +56,12 @@ class NetworkCommand(BaseCommand):
         "disable", "name"
     ]
 
+    # Enough to list ranges and find their DHCP servers
+    RANGE_RETURN_FIELDS_MINIMAL = [
+        "start_addr", "end_addr", "server_association_type",
+        "member", "failover_association"
+    ]
+
     MEMBER_DHCP_FIELDS = [
         "host_name", "ipv4addr", "enable_dhcp"
     ]
@@ -50,6 +81,11 @@ class NetworkCommand(BaseCommand):
             all_views: If True, search across all network views
             include_audit: Include audit trail (default: True)
             include_ips: Include all IP addresses in the network (default: True)
+            detail: Request options, extattrs and other full network and
+                range fields (default: True); False fetches only what the
+                summary and DHCP server lookup need
+            summary_only: Return only the _summary dict, without the
+                ranges, leases, IP addresses and other detail sections
 
         Returns:
             Network details including DHCP ranges, leases, IPs, and audit info
@@ -58,9 +94,14 @@ class NetworkCommand(BaseCommand):
         all_views = kwargs.get("all_views", False)
         include_audit = kwargs.get("include_audit", True)
         include_ips = kwargs.get("include_ips", True)
+        detail = kwargs.get("detail", True)
+        summary_only = kwargs.get("summary_only", False)
+
+        network_fields = self.RETURN_FIELDS if detail else self.RETURN_FIELDS_MINIMAL
+        range_fields = self.RANGE_RETURN_FIELDS if detail else self.RANGE_RETURN_FIELDS_MINIMAL
 
         # 1. Get Network Object
-        network, error_response = self._get_network(query, network_view, all_views)
+        network, error_response = self._get_network(query, network_view, all_views, network_fields)
         if error_response:
             return error_response
         
@@ -72,27 +113,54 @@ class NetworkCommand(BaseCommand):
         if actual_view:
             related_params["network_view"] = actual_view
 
-        # 2. Get DHCP Ranges
-        ranges = self._get_dhcp_ranges(related_params)
+        # 2-6. Ranges, leases, IPs and audit are independent lookups,
+        # so run them concurrently; member lookups follow the ranges
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="ddi-network") as executor:
+            ranges_future = executor.submit(self._get_dhcp_ranges, related_params, range_fields)
+            leases_future = executor.submit(self._get_active_leases, related_params)
+            ips_future = executor.submit(self._get_ip_addresses, related_params, include_ips)
+            audit_future = executor.submit(self._get_audit_info, object_ref, query, include_audit)
 
-        # 3. Get DHCP Servers and Options
-        dhcp_servers = self._get_dhcp_servers(ranges)
-        effective_options = self._get_effective_options(network, ranges)
+            # 2. Get DHCP Ranges
+            ranges = ranges_future.result()
 
-        # 4. Get Active Leases
-        leases = self._get_active_leases(related_params)
+            # 3. Get DHCP Servers and Options
+            dhcp_servers = self._get_dhcp_servers(ranges)
+            effective_options = self._get_effective_options(network, ranges)
 
-        # 5. Get IP Addresses
-        ip_addresses, ip_stats = self._get_ip_addresses(related_params, include_ips)
+            # 4. Get Active Leases
+            leases = leases_future.result()
 
-        # 6. Get Audit Info
-        audit_info, audit_summary = self._get_audit_info(
-            object_ref, query, include_audit
-        )
+            # 5. Get IP Addresses
+            ip_addresses, ip_stats = ips_future.result()
+
+            # 6. Get Audit Info
+            audit_info, audit_summary = audit_future.result()
 
         # 7. Build Response
         view_note = network.get("_view_note")
         all_views_found = network.get("_all_views", [])
+        range_count = len(ranges)
+        server_count = len(dhcp_servers)
+        lease_count = len(leases)
+        timestamps = audit_info.get("timestamps", {})
+        recent_changes = audit_info.get("wapi_audit") or []
+
+        summary = {
+            "Network": query,
+            "View": network.get("network_view", "N/A"),
+            **({"Note": view_note} if view_note else {}),
+            "Utilization": f"{network.get('utilization', 'N/A')}%",
+            "Total Hosts": network.get("total_hosts", "N/A"),
+            "Used IPs": ip_stats["used"],
+            "Unused IPs": ip_stats["unused"],
+            "DHCP Ranges": range_count,
+            "DHCP Servers": server_count,
+            "Active Leases": lease_count,
+            **audit_summary
+        }
+        if summary_only:
+            return {"_summary": summary}
 
         result = {
             "network": network.get("network"),
@@ -109,13 +177,13 @@ class NetworkCommand(BaseCommand):
             },
             "dhcp": {
                 "ranges": ranges,
-                "range_count": len(ranges),
+                "range_count": range_count,
                 "servers": dhcp_servers,
-                "server_count": len(dhcp_servers),
+                "server_count": server_count,
                 "effective_options": effective_options
             },
             "active_leases": leases,
-            "lease_count": len(leases),
+            "lease_count": lease_count,
             "ip_addresses": ip_addresses,
             "ip_statistics": {
                 "total": ip_stats["total"],
@@ -126,33 +194,22 @@ class NetworkCommand(BaseCommand):
             "members": network.get("members", []),
             "extattrs": network.get("extattrs", {}),
             "audit": {
-                "created": audit_info.get("timestamps", {}).get("created"),
+                "created": timestamps.get("created"),
                 "created_by": audit_info.get("created_by"),
-                "last_modified": audit_info.get("timestamps", {}).get("last_modified"),
+                "last_modified": timestamps.get("last_modified"),
                 "last_modified_by": audit_info.get("last_modified_by"),
-                "recent_changes": audit_info.get("wapi_audit", [])[:5],
+                "recent_changes": recent_changes[:5],
                 "splunk_audit": audit_info.get("splunk_audit", [])
             },
             "_ref": object_ref,
-            "_summary": {
-                "Network": query,
-                "View": network.get("network_view", "N/A"),
-                **({"Note": view_note} if view_note else {}),
-                "Utilization": f"{network.get('utilization', 'N/A')}%",
-                "Total Hosts": network.get("total_hosts", "N/A"),
-                "Used IPs": ip_stats["used"],
-                "Unused IPs": ip_stats["unused"],
-                "DHCP Ranges": len(ranges),
-                "DHCP Servers": len(dhcp_servers),
-                "Active Leases": len(leases),
-                **audit_summary
-            }
+            "_summary": summary
         }
 
         return result
 
     def _get_network(
-        self, query: str, network_view: str, all_views: bool
+        self, query: str, network_view: str, all_views: bool,
+        return_fields: Optional[List[str]] = None
     ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """Fetch the network object, handling view logic.
 
@@ -170,7 +227,7 @@ class NetworkCommand(BaseCommand):
         networks = self.client.get(
             "network",
             params=params,
-            return_fields=self.RETURN_FIELDS
+            return_fields=return_fields or self.RETURN_FIELDS
         )
 
         if not networks:
@@ -179,7 +236,7 @@ class NetworkCommand(BaseCommand):
                 all_networks = self.client.get(
                     "network",
                     params={"network": query},
-                    return_fields=self.RETURN_FIELDS
+                    return_fields=return_fields or self.RETURN_FIELDS
                 )
 
                 if all_networks:
@@ -206,12 +263,14 @@ class NetworkCommand(BaseCommand):
 
         return networks[0], {}
 
-    def _get_dhcp_ranges(self, params: Dict[str, str]) -> List[Dict[str, Any]]:
+    def _get_dhcp_ranges(
+        self, params: Dict[str, str], return_fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """Fetch DHCP ranges for the network."""
         return self.client.get(
             "range",
             params=params,
-            return_fields=self.RANGE_RETURN_FIELDS
+            return_fields=return_fields or self.RANGE_RETURN_FIELDS
         )
 
     def _get_dhcp_servers(self, ranges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -219,39 +278,37 @@ class NetworkCommand(BaseCommand):
         if not ranges:
             return []
 
-        member_set = set()
-        for rng in ranges:
-            member = rng.get("member")
-            if member and isinstance(member, dict):
-                # Member could be struct with _struct field
-                member_name = member.get("name") or member.get("_struct")
-                if member_name:
-                    member_set.add(member_name)
-            elif member and isinstance(member, str):
-                member_set.add(member)
-
-            # Also check failover association for servers
-            failover = rng.get("failover_association")
-            if failover:
-                member_set.add(failover)
-
-        dhcp_servers = []
-        for member_name in member_set:
-            try:
-                member_info = self.client.get(
-                    "member:dhcpproperties",
-                    params={"host_name": member_name},
-                    return_fields=[
-                        "host_name", "ipv4addr", "enable_dhcp",
-                        "options", "option"
-                    ]
-                )
-                if member_info:
-                    dhcp_servers.append(member_info[0])
-            except Exception:
-                pass
-        
-        return dhcp_servers
+        member_set = {
+            name for rng in ranges for name in _range_member_names(rng) if name
+        }
+
+        if not member_set:
+            return []
+
+        # One lookup for all members: exact match for a single name,
+        # otherwise an anchored regex alternation over the names
+        if len(member_set) == 1:
+            params = {"host_name": next(iter(member_set))}
+        else:
+            params = {"host_name~": "^(" + "|".join(_REGEX_SPECIAL.sub(r"\\\1", m) for m in member_set) + ")$"}
+
+        try:
+            members = self.client.get(
+                "member:dhcpproperties",
+                params=params,
+                return_fields=[
+                    "host_name", "ipv4addr", "enable_dhcp",
+                    "options", "option"
+                ]
+            )
+        except Exception:
+            return []
+
+        by_name = {}
+        for member_info in members:
+            by_name.setdefault(member_info.get("host_name"), member_info)
+
+        return [by_name[name] for name in member_set if name in by_name]
 
     def _get_effective_options(
         self, network: Dict[str, Any], ranges: List[Dict[str, Any]]
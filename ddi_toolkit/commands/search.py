@@ -4,12 +4,16 @@ Intelligent search command with auto-detection and type prefixes.
 
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Tuple, Optional
 from .base import BaseCommand
 from ..wapi import WAPIError
 
 logger = logging.getLogger(__name__)
 
+# Object types are searched concurrently; the WAPI session pools 10 connections
+_SEARCH_WORKERS = 8
+
 
 class SearchCommand(BaseCommand):
     """Intelligent search across InfoBlox objects with auto-detection."""
@@ -59,6 +63,16 @@ class SearchCommand(BaseCommand):
     MAC_PATTERN = re.compile(r'^([0-9a-fA-F]{2}[:\-]){5}[0-9a-fA-F]{2}$')
     FQDN_PATTERN = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9\-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]*[a-zA-Z0-9])?)+$')
 
+    # Single-pass variants: "<prefix>:<query>" and one named group per input type.
+    # Alternation order is detection priority (an IP also looks like an FQDN).
+    _PREFIX_RE = re.compile(r'(' + '|'.join(TYPE_PREFIXES) + r'):(.*)', re.IGNORECASE | re.DOTALL)
+    _INPUT_TYPE_RE = re.compile(
+        r'(?P<ip_address>(?:\d{1,3}\.){3}\d{1,3})'
+        r'|(?P<cidr>(?:\d{1,3}\.){3}\d{1,3}/\d{1,2})'
+        r'|(?P<mac_address>(?:[0-9a-fA-F]{2}[:\-]){5}[0-9a-fA-F]{2})'
+        r'|(?P<fqdn>[a-zA-Z0-9](?:[a-zA-Z0-9\-]*[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9\-]*[a-zA-Z0-9])?)+)'
+    )
+
     def _parse_type_prefix(self, query: str) -> Tuple[Optional[str], str]:
         """
         Parse type prefix from query if present.
@@ -70,11 +84,9 @@ class SearchCommand(BaseCommand):
             Tuple of (search_type, clean_query)
             search_type is None if no prefix found
         """
-        if ':' in query:
-            parts = query.split(':', 1)
-            prefix = parts[0].lower()
-            if prefix in self.TYPE_PREFIXES:
-                return self.TYPE_PREFIXES[prefix], parts[1]
+        match = self._PREFIX_RE.match(query)
+        if match:
+            return self.TYPE_PREFIXES[match.group(1).lower()], match.group(2)
         return None, query
 
     def _convert_wildcards(self, query: str) -> str:
@@ -106,32 +118,48 @@ class SearchCommand(BaseCommand):
         Returns:
             Tuple of (detected_type_name, list_of_object_types_to_search)
         """
-        # Check for IP address
-        if self.IP_PATTERN.match(query):
+        match = self._INPUT_TYPE_RE.fullmatch(query)
+        kind = match.lastgroup if match else None
+
+        if kind == "ip_address":
             return "ip_address", ["ipv4address", "record:host", "record:a", "record:ptr", "fixedaddress"]
 
-        # Check for CIDR
-        if self.CIDR_PATTERN.match(query):
+        if kind == "cidr":
             return "cidr", ["network", "networkcontainer"]
 
-        # Check for MAC address
-        if self.MAC_PATTERN.match(query):
+        if kind == "mac_address":
             return "mac_address", ["fixedaddress", "lease"]
 
-        # Check for FQDN (hostname.domain.tld)
-        if self.FQDN_PATTERN.match(query):
-            parts = query.split('.')
-            if len(parts) >= 3:
+        # FQDN (hostname.domain.tld)
+        if kind == "fqdn":
+            dots = query.count('.')
+            if dots >= 2:
                 # Looks like a hostname (e.g., server.example.com)
                 return "fqdn", ["record:host", "record:a", "record:cname", "record:ptr"]
-            elif len(parts) == 2:
-                # Looks like a zone (e.g., example.com)
-                return "zone", ["zone_auth", "record:host", "record:a"]
+            # Looks like a zone (e.g., example.com)
+            return "zone", ["zone_auth", "record:host", "record:a"]
 
         # Default to generic text search
         return "text", ["record:host", "record:a", "record:cname", "zone_auth",
                         "network", "networkcontainer", "fixedaddress"]
 
+    def _classify_query(self, query: str) -> Tuple[Optional[str], Optional[str], str]:
+        """
+        Parse the type prefix and detect the input type in one call.
+
+        Args:
+            query: Search query, possibly with a type prefix
+
+        Returns:
+            Tuple of (forced_type, detected_type, clean_query);
+            detected_type is None when a prefix forces the type
+        """
+        forced_type, clean_query = self._parse_type_prefix(query)
+        if forced_type:
+            return forced_type, None, clean_query
+        detected_type, _ = self._detect_input_type(clean_query)
+        return None, detected_type, clean_query
+
     def _get_search_types_for_forced_type(self, forced_type: str) -> List[str]:
         """Get object types to search for a forced type prefix."""
         type_mapping = {
@@ -275,13 +303,16 @@ class SearchCommand(BaseCommand):
                     return_fields=return_fields,
                     max_results=max_results
                 )
-                by_cidr = self.client.get(
-                    obj_type,
-                    params={"network~": query, **view_filter},
-                    return_fields=return_fields,
-                    max_results=max_results
-                )
-                results = by_comment + by_cidr
+                results = by_comment
+                # Comment matches already fill the quota; skip the CIDR search
+                if len(by_comment) < max_results:
+                    by_cidr = self.client.get(
+                        obj_type,
+                        params={"network~": query, **view_filter},
+                        return_fields=return_fields,
+                        max_results=max_results
+                    )
+                    results = by_comment + by_cidr
 
             elif obj_type == "networkcontainer":
                 by_comment = self.client.get(
@@ -290,13 +321,16 @@ class SearchCommand(BaseCommand):
                     return_fields=return_fields,
                     max_results=max_results
                 )
-                by_cidr = self.client.get(
-                    obj_type,
-                    params={"network~": query, **view_filter},
-                    return_fields=return_fields,
-                    max_results=max_results
-                )
-                results = by_comment + by_cidr
+                results = by_comment
+                # Comment matches already fill the quota; skip the CIDR search
+                if len(by_comment) < max_results:
+                    by_cidr = self.client.get(
+                        obj_type,
+                        params={"network~": query, **view_filter},
+                        return_fields=return_fields,
+                        max_results=max_results
+                    )
+                    results = by_comment + by_cidr
 
             elif obj_type == "fixedaddress":
                 # Search by name
@@ -308,7 +342,7 @@ class SearchCommand(BaseCommand):
                 )
                 results = by_name
                 # Search by MAC if query looks like MAC
-                if self.MAC_PATTERN.match(query):
+                if self.MAC_PATTERN.match(query) and len(results) < max_results:
                     by_mac = self.client.get(
                         obj_type,
                         params={"mac": query, **view_filter},
@@ -317,7 +351,7 @@ class SearchCommand(BaseCommand):
                     )
                     results.extend(by_mac)
                 # Search by IP if query looks like IP
-                if self.IP_PATTERN.match(query):
+                if self.IP_PATTERN.match(query) and len(results) < max_results:
                     by_ip = self.client.get(
                         obj_type,
                         params={"ipv4addr": query, **view_filter},
@@ -360,6 +394,43 @@ class SearchCommand(BaseCommand):
 
         return unique_results
 
+    def _search_object_types(
+        self,
+        obj_types: List[str],
+        query: str,
+        view_filter: Dict,
+        max_results: int
+    ) -> Dict[str, List[Dict]]:
+        """
+        Search several object types concurrently.
+
+        Each type is an independent WAPI round trip, so they run in a small
+        thread pool; _search_object_type already logs and swallows errors.
+
+        Returns:
+            Dict of obj_type -> results, in the order of obj_types
+        """
+        if len(obj_types) < 2:
+            return {
+                obj_type: self._search_object_type(obj_type, query, view_filter, max_results)
+                for obj_type in obj_types
+            }
+
+        # Create the lazy client here so worker threads don't race to build it;
+        # a configuration error is left for each search to log as before
+        try:
+            self.client
+        except WAPIError:
+            pass
+
+        workers = min(len(obj_types), _SEARCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ddi-search") as executor:
+            futures = [
+                (obj_type, executor.submit(self._search_object_type, obj_type, query, view_filter, max_results))
+                for obj_type in obj_types
+            ]
+            return {obj_type: future.result() for obj_type, future in futures}
+
     def _full_search(
         self,
         query: str,
@@ -375,9 +446,15 @@ class SearchCommand(BaseCommand):
             "zone_auth", "network", "networkcontainer", "fixedaddress"
         ]
 
+        # '/' and ':' never appear in DNS names, so a CIDR or MAC query
+        # cannot match a record or zone; skip those round trips
+        match = self._INPUT_TYPE_RE.fullmatch(query)
+        if match and match.lastgroup in ("cidr", "mac_address"):
+            all_types = [t for t in all_types if not t.startswith("record:") and t != "zone_auth"]
+
         results = {}
-        for obj_type in all_types:
-            type_results = self._search_object_type(obj_type, query, view_filter, max_results)
+        by_type = self._search_object_types(all_types, query, view_filter, max_results)
+        for obj_type, type_results in by_type.items():
             if type_results:
                 # Convert obj_type to friendly name
                 friendly_name = obj_type.replace("record:", "") + "_records" if obj_type.startswith("record:") else obj_type
@@ -439,8 +516,8 @@ class SearchCommand(BaseCommand):
             results = self._full_search(clean_query, view_filter, max_results)
             searched_types = ["all"]
         else:
-            for obj_type in search_types:
-                type_results = self._search_object_type(obj_type, clean_query, view_filter, max_results)
+            by_type = self._search_object_types(search_types, clean_query, view_filter, max_results)
+            for obj_type, type_results in by_type.items():
                 if type_results:
                     # Convert obj_type to friendly name
                     if obj_type.startswith("record:"):
@@ -5,9 +5,11 @@ Configuration management - load, save, and prompt for settings.
 import json
 import os
 import sys
-import base64
+import binascii
+import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 # Config file location (same directory as this file's parent)
 CONFIG_FILE = Path(__file__).parent.parent / "config.json"
@@ -48,15 +50,36 @@ def config_exists() -> bool:
     return CONFIG_FILE.exists()
 
 
+@lru_cache(maxsize=4)
+def _read_config(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file; cached per (path, mtime, size) so edits are picked up."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return DEFAULT_CONFIG
+
+
+def _config_key() -> Optional[Tuple[str, int, int]]:
+    """(path, mtime_ns, size) of the config file, or None if it is missing."""
+    try:
+        stat = CONFIG_FILE.stat()
+    except OSError:
+        return None
+    return str(CONFIG_FILE), stat.st_mtime_ns, stat.st_size
+
+
+def _current_config() -> Dict[str, Any]:
+    """Shared, parsed config. Callers must not modify the returned dict."""
+    key = _config_key()
+    if key is None:
+        return DEFAULT_CONFIG
+    return _read_config(*key)
+
+
 def load_config() -> Dict[str, Any]:
     """Load config from file or return defaults."""
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return DEFAULT_CONFIG.copy()
-    return DEFAULT_CONFIG.copy()
+    return copy.deepcopy(_current_config())
 
 
 def save_config(config: Dict[str, Any]) -> None:
@@ -65,6 +88,8 @@ def save_config(config: Dict[str, Any]) -> None:
         json.dump(config, f, indent=2)
     # Restrict permissions (owner read/write only)
     os.chmod(CONFIG_FILE, 0o600)
+    _read_config.cache_clear()
+    _infoblox_creds.cache_clear()
 
 
 def encode_password(password: str) -> str:
@@ -75,7 +100,7 @@ def encode_password(password: str) -> str:
     """
     if not password:
         return ""
-    return base64.b64encode(password.encode()).decode()
+    return binascii.b2a_base64(password.encode(), newline=False).decode("ascii")
 
 
 def decode_password(encoded: str) -> str:
@@ -83,7 +108,7 @@ def decode_password(encoded: str) -> str:
     if not encoded:
         return ""
     try:
-        return base64.b64decode(encoded.encode()).decode()
+        return binascii.a2b_base64(encoded.encode()).decode()
     except Exception:
         return encoded
 
@@ -95,7 +120,13 @@ def get_infoblox_creds() -> tuple:
     Returns:
         Tuple of (grid_master, username, password, wapi_version, verify_ssl, timeout)
     """
-    config = load_config()
+    return _infoblox_creds(_config_key())
+
+
+@lru_cache(maxsize=4)
+def _infoblox_creds(key: Optional[Tuple[str, int, int]]) -> tuple:
+    """Credentials tuple for a config file version, password decoded once."""
+    config = DEFAULT_CONFIG if key is None else _read_config(*key)
     ib = config.get("infoblox", {})
     return (
         ib.get("grid_master", ""),
@@ -112,19 +143,23 @@ def is_configured() -> bool:
     if not config_exists():
         return False
 
-    config = load_config()
+    config = _current_config()
     ib = config.get("infoblox", {})
     return bool(ib.get("grid_master") and ib.get("username") and ib.get("password"))
 
 
-def get_view_settings() -> Dict[str, Any]:
+def get_view_settings(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Get current network view settings.
 
+    Args:
+        config: Already loaded config to read from (default: config file)
+
     Returns:
         Dict with view_mode, network_view, and dns_view
     """
-    config = load_config()
+    if config is None:
+        config = _current_config()
     defaults = config.get("defaults", {})
     return {
         "view_mode": defaults.get("view_mode", "default"),
@@ -133,7 +168,12 @@ def get_view_settings() -> Dict[str, Any]:
     }
 
 
-def set_view_settings(view_mode: str, network_view: str = "default", dns_view: str = "default") -> None:
+def set_view_settings(
+    view_mode: str,
+    network_view: str = "default",
+    dns_view: str = "default",
+    config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Update network view settings.
 
@@ -141,8 +181,13 @@ def set_view_settings(view_mode: str, network_view: str = "default", dns_view: s
         view_mode: "default", "all", or "specific"
         network_view: Network view name (used when mode is "default" or "specific")
         dns_view: DNS view name
+        config: Loaded config to update in place (default: load from file)
+
+    Returns:
+        The saved config
     """
-    config = load_config()
+    if config is None:
+        config = load_config()
     if "defaults" not in config:
         config["defaults"] = {}
 
@@ -151,6 +196,7 @@ def set_view_settings(view_mode: str, network_view: str = "default", dns_view: s
     config["defaults"]["dns_view"] = dns_view
 
     save_config(config)
+    return config
 
 
 def run_first_time_setup() -> Dict[str, Any]:
@@ -165,7 +211,7 @@ def run_first_time_setup() -> Dict[str, Any]:
     clear_screen()
     print_welcome()
 
-    config = DEFAULT_CONFIG.copy()
+    config = copy.deepcopy(DEFAULT_CONFIG)
     ib = config["infoblox"]
 
     print(f"\n  {bold('InfoBlox Grid Master Configuration')}\n")
@@ -50,6 +50,16 @@ def flatten_dict(d: Dict, parent_key: str = '', sep: str = '.') -> Dict:
     return dict(items)
 
 
+def _csv_rows(flat_records: List[Dict], fieldnames: List[str]) -> List[List[Any]]:
+    """
+    Project flattened records onto fieldnames for csv.writer.
+
+    Missing keys become empty cells and keys outside fieldnames are
+    dropped, as csv.DictWriter(restval='', extrasaction='ignore') would.
+    """
+    return [[r.get(k, '') for k in fieldnames] for r in flat_records]
+
+
 class OutputWriter:
     """Handles writing output to JSON and CSV files."""
 
@@ -145,9 +155,12 @@ class OutputWriter:
             "data": json_data
         }
 
+        # Encode in one go and write once; json.dump with indent makes a
+        # write() call per token. Large datasets stream via _write_large.
+        encoded = json.dumps(output_json, indent=2, default=str)
         try:
             with open(json_path, 'w') as f:
-                json.dump(output_json, f, indent=2, default=str)
+                f.write(encoded)
         except IOError as e:
             raise IOError(f"Failed to write JSON output to {json_path}: {e}")
 
@@ -162,10 +175,11 @@ class OutputWriter:
                 for r in flat_records:
                     all_keys.update(r.keys())
 
+                fieldnames = sorted(all_keys)
                 with open(csv_path, 'w', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=sorted(all_keys))
-                    writer.writeheader()
-                    writer.writerows(flat_records)
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
+                    writer.writerows(_csv_rows(flat_records, fieldnames))
             else:
                 # Empty CSV with metadata
                 with open(csv_path, 'w', newline='') as f:
@@ -243,15 +257,15 @@ class OutputWriter:
             fieldnames = sorted(all_keys)
 
             with open(csv_path, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
 
                 # Write in batches to reduce I/O overhead
                 batch_size = 1000
                 for i in range(0, record_count, batch_size):
                     batch = records[i:i + batch_size]
                     flat_batch = [flatten_dict(r) for r in batch]
-                    writer.writerows(flat_batch)
+                    writer.writerows(_csv_rows(flat_batch, fieldnames))
         else:
             with open(csv_path, 'w', newline='') as f:
                 writer = csv.writer(f)
@@ -305,6 +319,7 @@ class OutputWriter:
             json_file.write(f'  "data": [\n')
 
             csv_writer = None
+            fieldnames = []
 
             for batch in record_generator:
                 if not batch:
@@ -315,12 +330,9 @@ class OutputWriter:
                     for r in batch[:100]:
                         flat = flatten_dict(r)
                         all_keys.update(flat.keys())
-                    csv_writer = csv.DictWriter(
-                        csv_file,
-                        fieldnames=sorted(all_keys),
-                        extrasaction='ignore'
-                    )
-                    csv_writer.writeheader()
+                    fieldnames = sorted(all_keys)
+                    csv_writer = csv.writer(csv_file)
+                    csv_writer.writerow(fieldnames)
                     first_batch = False
 
                 # Write JSON records
@@ -335,7 +347,7 @@ class OutputWriter:
                 # Write CSV records
                 if csv_writer:
                     flat_batch = [flatten_dict(r) for r in batch]
-                    csv_writer.writerows(flat_batch)
+                    csv_writer.writerows(_csv_rows(flat_batch, fieldnames))
 
             # Close JSON array
             json_file.write('\n  ]\n')
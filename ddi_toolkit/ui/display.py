@@ -7,11 +7,28 @@ import sys
 from typing import List, Optional
 from .colors import header, dim, bold, success, warning, error, Colors, IS_TTY
 
+# Status bar separator, drawn on every main menu render
+_STATUS_SEP = dim("─" * 60)
+
+# Dumb terminals still get a visual break, just without escape codes
+_IS_DUMB_TTY = sys.stdout.isatty() and os.environ.get("TERM") == "dumb"
+
 
 def clear_screen():
-    """Clear terminal screen."""
+    """Clear terminal screen.
+
+    Writes the ANSI cursor-home/clear sequence directly instead of
+    shelling out to ``clear`` on every screen transition.
+    """
     if IS_TTY:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            sys.stdout.write('\x1b[H\x1b[2J')
+            sys.stdout.flush()
+    elif _IS_DUMB_TTY:
+        sys.stdout.write('\n' * 40)
+        sys.stdout.flush()
 
 
 def print_banner():
@@ -43,12 +60,12 @@ def print_status(grid_master: str, username: str, connected: bool = False):
     status_color = Colors.GREEN if connected else Colors.RED
     state_text = "Connected" if connected else "Not Connected"
 
-    print(dim("─" * 60))
+    print(_STATUS_SEP)
     gm_display = grid_master if grid_master else "Not Configured"
     user_display = username if username else "N/A"
     print(f"  Grid Master: {bold(gm_display)}")
     print(f"  User: {bold(user_display)}  |  Status: {status_color}{status_icon}{Colors.RESET} {state_text}")
-    print(dim("─" * 60))
+    print(_STATUS_SEP)
 
 
 def print_section(title: str):
@@ -3,6 +3,7 @@ Main interactive menu system.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from .display import (
     clear_screen, print_banner, print_status,
@@ -18,12 +19,22 @@ from ..config import (
     is_configured, decode_password, get_view_settings, set_view_settings
 )
 from ..wapi import WAPIClient, WAPIError, reset_client
+from ..audit import reset_audit_client
 from ..network_view import (
     get_network_views, get_network_view_names,
     get_dns_views, get_dns_view_names, format_view_list,
     VIEW_MODE_DEFAULT, VIEW_MODE_ALL, VIEW_MODE_SPECIFIC
 )
 
+# Static menu fragments - styling is fixed at import time, so build once
+_SEP60 = dim("─" * 60)
+_SEP56 = dim("─" * 56)
+_CYAN_BRACKETS = {k: f"{Colors.CYAN}[{k}]{Colors.RESET}" for k in "1234567"}
+_YELLOW_BRACKETS = {k: f"{Colors.YELLOW}[{k}]{Colors.RESET}" for k in "VCTHQB"}
+
+# Main menu keys - only the first character of the input is significant
+_VALID_CHOICES = frozenset("1234567BVCTHQ")
+
 
 class MainMenu:
     """Interactive main menu."""
@@ -33,6 +44,26 @@ class MainMenu:
         self.config = load_config()
         self.running = True
         self.connected = False
+        # Cached is_configured() result; reset by _configure and on 401
+        self._configured = None
+        # View settings read by the last main menu render
+        self._view_settings = None
+        # Shared pool for background work (prefetches etc.)
+        self._bg = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ddi-menu")
+
+    def __del__(self):
+        self._shutdown_bg()
+
+    def _shutdown_bg(self):
+        """Stop the background pool without waiting on in-flight work."""
+        bg = getattr(self, "_bg", None)
+        if bg is None:
+            return
+        if sys.version_info >= (3, 9):
+            bg.shutdown(wait=False, cancel_futures=True)
+        else:
+            bg.shutdown(wait=False)
+        self._bg = None
 
     def show(self):
         """Display main menu and handle input loop."""
@@ -54,8 +85,8 @@ class MainMenu:
             self.connected
         )
 
-        # Show current view setting
-        view_settings = get_view_settings()
+        # Show current view setting (kept for the action picked from this screen)
+        view_settings = self._view_settings = get_view_settings()
         view_mode = view_settings.get("view_mode", "default")
         if view_mode == VIEW_MODE_ALL:
             view_display = "All Views"
@@ -65,36 +96,37 @@ class MainMenu:
             view_display = f"{view_settings.get('network_view', 'default')} (default)"
 
         print(f"  Network View: {bold(view_display)}")
-        print(dim("─" * 60))
+        print(_SEP60)
 
         # Menu options
         print(f"""
   {bold("QUERY COMMANDS")}
 
-  {Colors.CYAN}[1]{Colors.RESET} Query Network        {dim("CIDR, utilization, DHCP pools")}
-  {Colors.CYAN}[2]{Colors.RESET} Query IP Address     {dim("Status, bindings, conflicts")}
-  {Colors.CYAN}[3]{Colors.RESET} Query DNS Zone       {dim("Zone details, record counts")}
-  {Colors.CYAN}[4]{Colors.RESET} Query Container      {dim("Network containers, hierarchy")}
-  {Colors.CYAN}[5]{Colors.RESET} Query DHCP           {dim("Pools, leases, failover")}
-  {Colors.CYAN}[6]{Colors.RESET} Search               {dim("Global search across objects")}
-  {Colors.CYAN}[7]{Colors.RESET} Bulk Operations      {dim("Create/modify/delete from file")}
-
-  {dim("─" * 56)}
-
-  {Colors.YELLOW}[V]{Colors.RESET} Network View        {dim("Select default, all, or specific")}
-  {Colors.YELLOW}[C]{Colors.RESET} Configuration       {dim("Grid Master, credentials")}
-  {Colors.YELLOW}[T]{Colors.RESET} Test Connection     {dim("Verify InfoBlox connectivity")}
-  {Colors.YELLOW}[H]{Colors.RESET} Help                {dim("Usage and documentation")}
-  {Colors.YELLOW}[Q]{Colors.RESET} Quit
+  {_CYAN_BRACKETS["1"]} Query Network        {dim("CIDR, utilization, DHCP pools")}
+  {_CYAN_BRACKETS["2"]} Query IP Address     {dim("Status, bindings, conflicts")}
+  {_CYAN_BRACKETS["3"]} Query DNS Zone       {dim("Zone details, record counts")}
+  {_CYAN_BRACKETS["4"]} Query Container      {dim("Network containers, hierarchy")}
+  {_CYAN_BRACKETS["5"]} Query DHCP           {dim("Pools, leases, failover")}
+  {_CYAN_BRACKETS["6"]} Search               {dim("Global search across objects")}
+  {_CYAN_BRACKETS["7"]} Bulk Operations      {dim("Create/modify/delete from file")}
+
+  {_SEP56}
+
+  {_YELLOW_BRACKETS["V"]} Network View        {dim("Select default, all, or specific")}
+  {_YELLOW_BRACKETS["C"]} Configuration       {dim("Grid Master, credentials")}
+  {_YELLOW_BRACKETS["T"]} Test Connection     {dim("Verify InfoBlox connectivity")}
+  {_YELLOW_BRACKETS["H"]} Help                {dim("Usage and documentation")}
+  {_YELLOW_BRACKETS["Q"]} Quit
         """)
 
     def _get_menu_choice(self) -> str:
         """Get menu choice from user."""
         try:
-            choice = input(f"\n  {bold('Select option')}: ").strip().upper()
-            return choice
+            s = input(f"\n  {bold('Select option')}: ").strip()
         except (KeyboardInterrupt, EOFError):
             return 'Q'
+        choice = s[:1].upper()
+        return choice if choice in _VALID_CHOICES else ''
 
     def _handle_choice(self, choice: str):
         """Handle menu selection."""
@@ -123,24 +155,27 @@ class MainMenu:
 
     def _ensure_configured(self) -> bool:
         """Check if InfoBlox is configured."""
-        if not is_configured():
+        if not self._configured:
+            self._configured = is_configured()
+        if not self._configured:
             print(error("\n  InfoBlox not configured. Please configure first (C)."))
             input("\n  Press Enter to continue...")
             return False
         return True
 
-    def _get_effective_view(self, view_type: str = "network") -> tuple:
+    def _get_effective_view(self, view_type: str = "network", settings: Optional[dict] = None) -> tuple:
         """
         Get effective view based on current settings.
 
         Args:
             view_type: "network" or "dns"
+            settings: Already-loaded view settings (read from config if None)
 
         Returns:
             Tuple of (view_name_or_none, is_all_views)
             When is_all_views is True, view_name is None
         """
-        view_settings = get_view_settings()
+        view_settings = settings if settings is not None else get_view_settings()
         view_mode = view_settings.get("view_mode", "default")
 
         if view_mode == VIEW_MODE_ALL:
@@ -215,6 +250,7 @@ class MainMenu:
             print(error(f"\n  API Error: {e.message}"))
             if e.status_code == 401:
                 self.connected = False
+                self._configured = None
         except Exception as e:
             print(error(f"\n  Error: {e}"))
 
@@ -229,7 +265,7 @@ class MainMenu:
         print(header("\n  ═══ QUERY NETWORK ═══\n"))
 
         # Show current view setting
-        view, is_all = self._get_effective_view("network")
+        view, is_all = self._get_effective_view("network", self._view_settings)
         if is_all:
             print(f"  {dim('View Mode: All Views')}\n")
         else:
@@ -253,7 +289,7 @@ class MainMenu:
         print(header("\n  ═══ QUERY IP ADDRESS ═══\n"))
 
         # Show current view setting
-        view, is_all = self._get_effective_view("network")
+        view, is_all = self._get_effective_view("network", self._view_settings)
         if is_all:
             print(f"  {dim('View Mode: All Views')}\n")
         else:
@@ -277,7 +313,7 @@ class MainMenu:
         print(header("\n  ═══ QUERY DNS ZONE ═══\n"))
 
         # Show current view setting (DNS uses same mode)
-        view, is_all = self._get_effective_view("dns")
+        view, is_all = self._get_effective_view("dns", self._view_settings)
         if is_all:
             print(f"  {dim('View Mode: All Views')}\n")
         else:
@@ -301,7 +337,7 @@ class MainMenu:
         print(header("\n  ═══ QUERY NETWORK CONTAINER ═══\n"))
 
         # Show current view setting
-        view, is_all = self._get_effective_view("network")
+        view, is_all = self._get_effective_view("network", self._view_settings)
         if is_all:
             print(f"  {dim('View Mode: All Views')}\n")
         else:
@@ -325,7 +361,7 @@ class MainMenu:
         print(header("\n  ═══ QUERY DHCP ═══\n"))
 
         # Show current view setting
-        view, is_all = self._get_effective_view("network")
+        view, is_all = self._get_effective_view("network", self._view_settings)
         if is_all:
             print(f"  {dim('View Mode: All Views')}\n")
         else:
@@ -356,12 +392,14 @@ class MainMenu:
         if not self._ensure_configured():
             return
 
+        # View settings cannot change inside the search loop
+        view, is_all = self._get_effective_view("network", self._view_settings)
+
         while True:
             clear_screen()
             print(header("\n  ═══ INTELLIGENT SEARCH ═══\n"))
 
             # Show current view setting
-            view, is_all = self._get_effective_view("network")
             if is_all:
                 print(f"  {dim('View Mode: All Views')}\n")
             else:
@@ -409,14 +447,13 @@ class MainMenu:
             cmd = cmd_class()
 
             # First, show what type was detected (before searching)
-            forced_type, clean_query = cmd._parse_type_prefix(query)
+            forced_type, detected_type, _ = cmd._classify_query(query)
             if forced_type:
                 if forced_type == "all":
                     detected_type = "Full Search (all types)"
                 else:
                     detected_type = f"Explicit: {forced_type}"
             else:
-                detected_type, _ = cmd._detect_input_type(clean_query)
                 type_labels = {
                     "ip_address": "IP Address",
                     "cidr": "CIDR Network",
@@ -541,13 +578,13 @@ class MainMenu:
 
   {bold("OPERATIONS")}
 
-  {Colors.CYAN}[1]{Colors.RESET} Bulk Create        {dim("Create objects from CSV/JSON file")}
-  {Colors.CYAN}[2]{Colors.RESET} Bulk Modify        {dim("Update objects from CSV/JSON file")}
-  {Colors.CYAN}[3]{Colors.RESET} Bulk Delete        {dim("Delete objects from CSV/JSON file")}
+  {_CYAN_BRACKETS["1"]} Bulk Create        {dim("Create objects from CSV/JSON file")}
+  {_CYAN_BRACKETS["2"]} Bulk Modify        {dim("Update objects from CSV/JSON file")}
+  {_CYAN_BRACKETS["3"]} Bulk Delete        {dim("Delete objects from CSV/JSON file")}
 
-  {dim("─" * 56)}
+  {_SEP56}
 
-  {Colors.YELLOW}[B]{Colors.RESET} Back to Main Menu
+  {_YELLOW_BRACKETS["B"]} Back to Main Menu
             """)
 
             choice = input(f"\n  {bold('Select option')}: ").strip().upper()
@@ -615,7 +652,7 @@ class MainMenu:
                     return
             except ValueError:
                 print(error(f"\n  Unsupported object type: {type_choice}"))
-                print(f"  {dim(f'Supported: {', '.join(type_list)}')}")
+                print(f"  {dim('Supported: ' + ', '.join(type_list))}")
                 input("\n  Press Enter to continue...")
                 return
 
@@ -633,6 +670,11 @@ class MainMenu:
             print(error(f"\n  File not found: {file_path}"))
             input("\n  Press Enter to continue...")
             return
+        if file_path.suffix.lower() not in ('.csv', '.json'):
+            print(error(f"\n  Unsupported file format: {file_path.suffix or '(none)'}"))
+            print(f"  {dim('Use a .csv or .json file')}")
+            input("\n  Press Enter to continue...")
+            return
 
         # Dry run option
         dry_run = prompt_confirm(
@@ -659,14 +701,16 @@ class MainMenu:
         try:
             cmd_class = get_command('bulk')
             cmd = cmd_class()
-            result = cmd.run(
-                operation,
-                quiet=False,
-                object_type=type_choice,
-                file=str(file_path),
-                dry_run=dry_run,
-                continue_on_error=True
-            )
+            with open(file_path, 'rb', buffering=1 << 20) as file_obj:
+                result = cmd.run(
+                    operation,
+                    quiet=False,
+                    object_type=type_choice,
+                    file=str(file_path),
+                    file_obj=file_obj,
+                    dry_run=dry_run,
+                    continue_on_error=True
+                )
 
             if result.get("error"):
                 print(error(f"\n  Error: {result.get('error')}"))
@@ -699,6 +743,9 @@ class MainMenu:
         print(f"  Current Mode: {bold(current_mode)}")
         print(f"  Current View: {bold(current_view)}\n")
 
+        # Fetch views in the background while the user picks a mode
+        views_future = self._bg.submit(get_network_views)
+
         # Mode selection
         mode_choice = prompt_choice(
             "Select View Mode",
@@ -716,7 +763,7 @@ class MainMenu:
             print(f"\n  {dim('Fetching network views from InfoBlox...')}\n")
 
             try:
-                views = get_network_views()
+                views = views_future.result()
 
                 if not views:
                     print(error("\n  No network views found."))
@@ -731,10 +778,11 @@ class MainMenu:
                     input("\n  Press Enter to continue...")
                     return
 
+                view_names = {name for name, _ in view_options}
                 selected_view = prompt_choice(
                     "Select Network View",
                     view_options,
-                    default=current_view if current_view in [v[0] for v in view_options] else view_options[0][0]
+                    default=current_view if current_view in view_names else view_options[0][0]
                 )
 
             except WAPIError as e:
@@ -761,8 +809,7 @@ class MainMenu:
 
         # Save settings
         dns_view = current_settings.get("dns_view", "default")
-        set_view_settings(mode_choice, selected_view, dns_view)
-        self.config = load_config()  # Refresh config
+        self.config = set_view_settings(mode_choice, selected_view, dns_view)
 
         print(f"\n  {success('Network view settings updated!')}")
         print(f"    Mode: {bold(mode_choice)}")
@@ -775,7 +822,9 @@ class MainMenu:
         """Open configuration editor."""
         self.config = run_config_editor()
         self.connected = False  # Reset connection after config change
+        self._configured = None
         reset_client()
+        reset_audit_client()
 
     def _test_connection(self):
         """Test InfoBlox connectivity."""
@@ -862,6 +911,7 @@ class MainMenu:
         """Exit application."""
         print(f"\n  {dim('Goodbye!')}\n")
         self.running = False
+        self._shutdown_bg()
 
 
 def run_interactive():
@@ -3,11 +3,17 @@ Interactive input prompts with defaults and validation.
 """
 
 import getpass
+import ipaddress
 import sys
 import re
 from typing import Optional, List, Callable, Any, Tuple
 from .colors import Colors, dim, bold, warning, error, IS_TTY
 
+# Validator patterns, compiled once at import (used with fullmatch)
+_IP_RE = re.compile(r'(?:\d{1,3}\.){3}\d{1,3}')
+_HOST_RE = re.compile(r'[a-zA-Z0-9](?:[a-zA-Z0-9\-\.]*[a-zA-Z0-9])?')
+_FQDN_RE = re.compile(r'[a-zA-Z0-9](?:[a-zA-Z0-9\-]*[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9\-]*[a-zA-Z0-9])?)*\.?')
+
 
 def prompt_input(
     label: str,
@@ -49,7 +55,15 @@ def prompt_input(
 
     while True:
         try:
-            if secret:
+            if secret and not sys.stdin.isatty():
+                # Piped input - getpass would go looking for a terminal
+                sys.stdout.write(prompt_str)
+                sys.stdout.flush()
+                value = sys.stdin.readline()
+                if not value:
+                    raise EOFError
+                value = value.rstrip("\n")
+            elif secret:
                 value = getpass.getpass(prompt_str)
             else:
                 value = input(prompt_str)
@@ -58,7 +72,8 @@ def prompt_input(
             return default or ""
 
         # Use default if empty
-        value = value.strip() if value.strip() else (default or "")
+        stripped = value.strip()
+        value = stripped if stripped else (default or "")
 
         # Validation
         if required and not value:
@@ -94,6 +109,9 @@ def prompt_choice(
         marker = ">" if key == default else " "
         print(f"    {marker} [{i}] {display}")
 
+    # Case-insensitive lookup for keys typed directly (first option wins)
+    key_map = {key.lower(): key for key, _ in reversed(options)}
+
     while True:
         try:
             choice = input(f"\n  Enter choice [1-{len(options)}]: ").strip()
@@ -110,9 +128,9 @@ def prompt_choice(
                 return options[idx][0]
         except ValueError:
             # Check if they typed the key directly
-            for key, _ in options:
-                if choice.lower() == key.lower():
-                    return key
+            key = key_map.get(choice.lower())
+            if key is not None:
+                return key
 
         print(warning(f"    Please enter 1-{len(options)}"))
 
@@ -151,44 +169,30 @@ def prompt_confirm(label: str, default: bool = True) -> bool:
 
 def validate_ip(value: str) -> bool:
     """Validate IP address or hostname."""
-    # Simple IP pattern
-    ip_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-    # Hostname pattern
-    hostname_pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]*[a-zA-Z0-9])?$'
-
-    return bool(re.match(ip_pattern, value) or re.match(hostname_pattern, value))
+    return _IP_RE.fullmatch(value) is not None or _HOST_RE.fullmatch(value) is not None
 
 
 def validate_cidr(value: str) -> bool:
     """Validate CIDR notation."""
-    pattern = r'^(\d{1,3}\.){3}\d{1,3}/\d{1,2}$'
-    if not re.match(pattern, value):
+    # Require an explicit numeric prefix length (no bare IPs or netmasks)
+    if not value.rpartition('/')[2].isdigit():
         return False
-
-    # Check valid IP octets and prefix
     try:
-        ip, prefix = value.split('/')
-        octets = [int(o) for o in ip.split('.')]
-        prefix = int(prefix)
-        return all(0 <= o <= 255 for o in octets) and 0 <= prefix <= 32
+        ipaddress.IPv4Network(value, strict=False)
+        return True
     except ValueError:
         return False
 
 
 def validate_ipv4(value: str) -> bool:
     """Validate IPv4 address."""
-    pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-    if not re.match(pattern, value):
-        return False
-
     try:
-        octets = [int(o) for o in value.split('.')]
-        return all(0 <= o <= 255 for o in octets)
+        ipaddress.IPv4Address(value)
+        return True
     except ValueError:
         return False
 
 
 def validate_fqdn(value: str) -> bool:
     """Validate FQDN (zone name)."""
-    pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]*[a-zA-Z0-9])?)*\.?$'
-    return bool(re.match(pattern, value)) and len(value) <= 253
+    return _FQDN_RE.fullmatch(value) is not None and len(value) <= 253
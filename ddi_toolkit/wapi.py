@@ -2,6 +2,8 @@
 InfoBlox WAPI Client - Reusable wrapper for all API calls.
 """
 
+import copy
+import time
 import requests
 import urllib3
 from typing import Optional, Dict, List, Any, Union
@@ -29,6 +31,12 @@ class WAPINotFoundError(WAPIError):
 class WAPIClient:
     """InfoBlox WAPI REST Client."""
 
+    # Non-paged GET results are reused for this many seconds; any write clears them.
+    # Larger results are not cached: copying them in and out costs more than it saves.
+    _get_cache_ttl = 60
+    _get_cache_max = 512
+    _get_cache_max_rows = 500
+
     def __init__(self):
         """Initialize client with credentials from config."""
         host, user, password, version, verify_ssl, timeout = get_infoblox_creds()
@@ -53,6 +61,9 @@ class WAPIClient:
             'Accept': 'application/json'
         })
 
+        # (object_type, query params) -> (monotonic fetch time, result)
+        self._get_cache: Dict[tuple, tuple] = {}
+
     def _request(
         self,
         method: str,
@@ -79,6 +90,10 @@ class WAPIClient:
         """
         url = f"{self.base_url}/{endpoint}"
 
+        # Writes may change anything a cached read returned
+        if method != "GET":
+            self._get_cache.clear()
+
         try:
             response = self.session.request(
                 method=method,
@@ -127,7 +142,8 @@ class WAPIClient:
         return_fields: Optional[List[str]] = None,
         max_results: Optional[int] = None,
         paging: bool = False,
-        page_size: int = 1000
+        page_size: int = 1000,
+        use_cache: bool = True
     ) -> List[Dict]:
         """
         GET objects from WAPI with optional paging for large datasets.
@@ -139,6 +155,8 @@ class WAPIClient:
             max_results: Maximum number of results (None = unlimited with paging)
             paging: Enable paging for large result sets
             page_size: Number of results per page (default 1000)
+            use_cache: Reuse an identical non-paged GET from the last 60 seconds
+                (results over _get_cache_max_rows rows are never cached)
 
         Returns:
             List of matching objects
@@ -158,12 +176,34 @@ class WAPIClient:
         if max_results:
             query_params["_max_results"] = str(max_results)
 
+        cache_key = None
+        if use_cache:
+            try:
+                cache_key = (object_type, frozenset(query_params.items()))
+                cached = self._get_cache.get(cache_key)
+            except TypeError:
+                # Unhashable parameter value; just don't cache this query
+                cache_key = cached = None
+            if cached and time.monotonic() - cached[0] < self._get_cache_ttl:
+                return copy.deepcopy(cached[1])
+
         result = self._request("GET", object_type, params=query_params)
 
         # Ensure we return a list
         if isinstance(result, dict):
-            return [result]
-        return result if result else []
+            result = [result]
+        elif not result:
+            result = []
+
+        if cache_key is not None and len(result) <= self._get_cache_max_rows:
+            if len(self._get_cache) >= self._get_cache_max:
+                self._get_cache.clear()
+            self._get_cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
+        return result
+
+    def clear_cache(self) -> None:
+        """Drop cached GET results (e.g., after changes made outside this client)."""
+        self._get_cache.clear()
 
     def _get_paged(
         self,
@@ -441,7 +481,7 @@ class WAPIClient:
         Raises:
             WAPIError: On connection failure
         """
-        result = self.get("grid", return_fields=["name", "service_status"])
+        result = self.get("grid", return_fields=["name", "service_status"], use_cache=False)
         if result:
             return result[0]
         raise WAPIError("Connected but no grid info returned")
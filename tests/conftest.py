@@ -13,6 +13,16 @@ from unittest.mock import Mock, patch, MagicMock
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+@pytest.fixture(autouse=True)
+def reset_singletons(tmp_path):
+    """Drop module-level clients and caches so tests never share state."""
+    from ddi_toolkit.audit import reset_audit_client
+    reset_audit_client()
+    with patch('ddi_toolkit.audit.AUDIT_CACHE_DIR', tmp_path):
+        yield
+    reset_audit_client()
+
+
 @pytest.fixture
 def mock_config():
     """Mock configuration data."""
@@ -9,12 +9,16 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import patch, Mock, MagicMock
 import tarfile
+import time
 import io
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ddi_toolkit.audit import AuditClient, get_audit_for_object, format_audit_summary, download_full_audit_log, _parse_timestamp
+from ddi_toolkit.audit import (
+    AuditClient, AuditEntry, get_audit_for_object, format_audit_summary, download_full_audit_log, _parse_timestamp,
+    get_audit_client, reset_audit_client, get_audit_for_objects, invalidate_audit_cache
+)
 
 
 class TestAuditClient:
@@ -81,10 +85,12 @@ class TestAuditClient:
         """Test audit when Splunk is enabled."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": {"_time": "2024-01-15T10:30:00", "admin": "jsmith", "action": "INSERT"}}'
+        mock_response.iter_lines.return_value = [
+            '{"result": {"_time": "2024-01-15T10:30:00", "admin": "jsmith", "action": "INSERT"}}'
+        ]
 
         with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
-            with patch('ddi_toolkit.audit.requests.post', return_value=mock_response):
+            with patch('ddi_toolkit.audit.requests.Session.post', return_value=mock_response):
                 client = AuditClient()
                 result = client.get_object_audit(
                     object_ref="network/test:10.20.30.0/24/default",
@@ -138,6 +144,26 @@ class TestAuditClient:
             assert "2024-01-10" in audit_info["timestamps"]["created"]
             assert "2024-01-15" in audit_info["timestamps"]["last_modified"]
 
+    def test_extract_audit_metadata_unordered(self, mock_config_splunk_enabled):
+        """Test created/modified come from the timestamp extremes, not list order."""
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            client = AuditClient()
+            audit_info = {"timestamps": {}, "created_by": None, "last_modified_by": None}
+
+            results = [
+                {"_time": "2024-01-12T08:00:00", "admin": "middle"},
+                {"timestamp": "2024-01-15 10:30:00", "user": "latest"},
+                {"admin": "no-time"},
+                {"_time": "2024-01-10T08:00:00", "src_user": "earliest"},
+                {"_time": "2024-01-15 10:30:00", "admin": "latest-tie"}
+            ]
+
+            client._extract_audit_metadata(audit_info, results)
+
+            assert audit_info["created_by"] == "earliest"
+            assert audit_info["last_modified_by"] == "latest-tie"
+            assert audit_info["timestamps"]["created"] == "2024-01-10T08:00:00"
+
     def test_normalize_splunk_result(self, mock_config_splunk_enabled):
         """Test normalizing Splunk result."""
         with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
@@ -163,7 +189,7 @@ class TestAuditClient:
         import requests
 
         with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
-            with patch('ddi_toolkit.audit.requests.post', side_effect=requests.exceptions.ConnectionError()):
+            with patch('ddi_toolkit.audit.requests.Session.post', side_effect=requests.exceptions.ConnectionError()):
                 client = AuditClient()
                 results = client._get_splunk_audit("10.20.30.0/24", "NETWORK")
 
@@ -177,7 +203,7 @@ class TestAuditClient:
         mock_response.status_code = 401
 
         with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
-            with patch('ddi_toolkit.audit.requests.post', return_value=mock_response):
+            with patch('ddi_toolkit.audit.requests.Session.post', return_value=mock_response):
                 client = AuditClient()
                 results = client._get_splunk_audit("10.20.30.0/24", "NETWORK")
 
@@ -189,10 +215,12 @@ class TestAuditClient:
         """Test Splunk with username/password authentication."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": {"_time": "2024-01-15T10:30:00", "admin": "jsmith", "action": "INSERT"}}'
+        mock_response.iter_lines.return_value = [
+            '{"result": {"_time": "2024-01-15T10:30:00", "admin": "jsmith", "action": "INSERT"}}'
+        ]
 
         with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_userpass):
-            with patch('ddi_toolkit.audit.requests.post', return_value=mock_response) as mock_post:
+            with patch('ddi_toolkit.audit.requests.Session.post', return_value=mock_response) as mock_post:
                 client = AuditClient()
                 results = client._get_splunk_audit("10.20.30.0/24", "NETWORK")
 
@@ -201,6 +229,246 @@ class TestAuditClient:
                 assert call_args.kwargs.get('auth') == ('splunkuser', 'splunkpass')
                 assert 'Authorization' not in call_args.kwargs.get('headers', {})
 
+    def test_splunk_stream_stops_at_max_results(self, mock_config_splunk_enabled):
+        """Test Splunk export is streamed and cut off at max_results."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_lines.return_value = [
+            b'{"result": {"_time": "2024-01-15T10:30:00", "admin": "jsmith"}}',
+            b'',
+            b'not json',
+            b'{"result": {"_time": "2024-01-14T10:30:00", "admin": "adoe"}}',
+            b'{"result": {"_time": "2024-01-13T10:30:00", "admin": "bob"}}',
+        ]
+
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            with patch('ddi_toolkit.audit.requests.Session.post', return_value=mock_response) as mock_post:
+                client = AuditClient()
+                results = client._get_splunk_audit("10.20.30.0/24", "NETWORK", max_results=2)
+
+                assert [r["admin"] for r in results] == ["jsmith", "adoe"]
+                assert mock_post.call_args.kwargs.get('stream') is True
+                mock_response.iter_lines.assert_called_once_with(chunk_size=65536)
+                mock_response.close.assert_called_once()
+
+    def test_get_object_audit_parallel(self, mock_config_splunk_enabled):
+        """Test parallel mode starts fileop alongside Splunk and uses it when Splunk fails."""
+        fileop_entries = [{"timestamp": "2024-01-15 10:30:00", "admin": "jsmith", "message": "INSERT NETWORK"}]
+
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            client = AuditClient()
+            with patch.object(client, '_get_splunk_audit', return_value=[{"error": "Splunk query timed out"}]), \
+                    patch.object(client, '_download_audit_log', return_value=[]) as mock_download, \
+                    patch.object(client, '_get_fileop_audit', return_value=fileop_entries) as mock_fileop:
+                result = client.get_object_audit("network/x:10.20.30.0/24/default", parallel=True)
+                client._prefetch.join(timeout=5)
+                assert mock_download.call_count == 1
+
+                assert result["source"] == "fileop"
+                assert result["splunk_error"] == "Splunk query timed out"
+                assert result["created_by"] == "jsmith"
+                mock_fileop.assert_called_once_with("10.20.30.0/24", None, 10)
+
+    def test_parallel_batch_downloads_audit_log_once(self, mock_config_splunk_enabled):
+        """Test a parallel batch answered by Splunk starts at most one archive download."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_lines.return_value = [
+            f'{{"result": {{"_time": "2024-01-15T10:30:00", "admin": "jsmith", "object_name": "fo{i}"}}}}'.encode()
+            for i in range(6)
+        ]
+        items = [(f"dhcpfailover/x:fo{i}", "DHCP_FAILOVER", f"fo{i}") for i in range(6)]
+
+        def slow_download():
+            time.sleep(0.05)
+            return []
+
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            with patch('ddi_toolkit.audit.requests.Session.post', return_value=mock_response):
+                client = AuditClient()
+                with patch.object(client, '_download_audit_log', side_effect=slow_download) as mock_download:
+                    results = client.get_audit_for_objects(items, max_results=3, parallel=True)
+                    # Single lookups in the same session reuse the running prefetch
+                    client.get_object_audit("dhcpfailover/x:fo9", "DHCP_FAILOVER", "fo9", parallel=True)
+                    client._prefetch.join(timeout=5)
+
+                assert all(r["source"] == "splunk" for r in results)
+                assert mock_download.call_count == 1
+
+    def test_prefetch_skipped_when_audit_log_cached(self, mock_config_splunk_enabled):
+        """Test no background download starts while the cached log is fresh."""
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            client = AuditClient()
+            client._audit_log_cache = [{"message": "INSERT NETWORK 10.1.0.0/16"}]
+            client._audit_log_cache_time = datetime.now()
+
+            assert client._prefetch_audit_log() is None
+            assert client._prefetch is None
+
+    def test_get_audit_for_objects_batches_splunk(self, mock_config_splunk_enabled):
+        """Test several objects share one Splunk search and get their own events back."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_lines.return_value = [
+            b'{"result": {"_time": "2024-01-15T10:30:00", "admin": "jsmith", "object_name": "10.1.0.0/16"}}',
+            b'{"result": {"_time": "2024-01-14T10:30:00", "admin": "adoe", "_raw": "UPDATE NETWORK 10.2.0.0/16"}}',
+        ]
+        items = [
+            ("network/a:10.1.0.0/16/default", "NETWORK", None),
+            ("network/b:10.2.0.0/16/default", "NETWORK", None),
+        ]
+
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            with patch('ddi_toolkit.audit.requests.Session.post', return_value=mock_response) as mock_post:
+                client = AuditClient()
+                results = client.get_audit_for_objects(items, max_results=3)
+
+                assert mock_post.call_count == 1
+                query = mock_post.call_args.kwargs["data"]["search"]
+                assert '("10.1.0.0/16" OR "10.2.0.0/16")' in query
+                assert "head 6" in query
+                assert query.endswith(", _raw")
+                assert [r["created_by"] for r in results] == ["jsmith", "adoe"]
+                assert all(r["source"] == "splunk" for r in results)
+
+    def test_splunk_batch_truncated_terms_need_own_search(self, mock_config_splunk_enabled):
+        """Test terms short of max_results in a cut-off batch are marked for a separate search."""
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            client = AuditClient()
+            rows = [{"_time": "2024-01-15T10:30:00", "object_name": "a"}] * 2
+            with patch.object(client, '_splunk_search', return_value=rows):
+                by_term = client._get_splunk_audit_batch(["a", "b"], max_results=1)
+
+            assert len(by_term["a"]) == 1
+            assert by_term["b"] is None
+
+    def test_splunk_batch_does_not_match_name_prefixes(self, mock_config_splunk_enabled):
+        """Test an event for one object is not handed to a name it contains."""
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            client = AuditClient()
+            rows = [
+                {"_time": "2024-01-15T10:30:00", "admin": "jsmith", "object_name": "fo10"},
+                {"_time": "2024-01-14T10:30:00", "admin": "adoe", "_raw": "UPDATE RANGE 10.0.0.1-10.0.0.50"},
+                {"_time": "2024-01-13T10:30:00", "admin": "bwho", "_raw": "INSERT RANGE 10.0.0.1-10.0.0.5 ok"},
+            ]
+            with patch.object(client, '_splunk_search', return_value=rows):
+                by_term = client._get_splunk_audit_batch(
+                    ["fo1", "fo10", "10.0.0.1-10.0.0.5", "10.0.0.1-10.0.0.50"], max_results=5
+                )
+
+            assert by_term["fo1"] == []
+            assert [r["admin"] for r in by_term["fo10"]] == ["jsmith"]
+            assert [r["admin"] for r in by_term["10.0.0.1-10.0.0.5"]] == ["bwho"]
+            assert [r["admin"] for r in by_term["10.0.0.1-10.0.0.50"]] == ["adoe"]
+
+    def test_get_object_audit_cached(self, mock_config_splunk_disabled):
+        """Test repeat lookups reuse the recent result until invalidated."""
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_disabled):
+            client = AuditClient()
+            with patch.object(client, '_get_fileop_audit', return_value=[]) as mock_fileop:
+                first = client.get_object_audit("network/x:10.1.0.0/16/default")
+                first["message"] = "changed by caller"
+                second = client.get_object_audit("network/x:10.1.0.0/16/default")
+
+                assert mock_fileop.call_count == 1
+                assert second["message"] != "changed by caller"
+
+                invalidate_audit_cache("network/x:10.1.0.0/16/default")
+                client.get_object_audit("network/x:10.1.0.0/16/default")
+                assert mock_fileop.call_count == 2
+
+    def test_audit_info_cache_evicts_least_recent(self, mock_config_splunk_disabled):
+        """Test the lookup cache stays bounded and drops the least recently used entry."""
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_disabled):
+            client = AuditClient()
+            with patch.object(AuditClient, '_audit_info_max', 2):
+                client._cache_audit_info(("a",), {"n": 1})
+                client._cache_audit_info(("b",), {"n": 2})
+                assert client._get_cached_audit_info(("a",)) == {"n": 1}
+
+                client._cache_audit_info(("c",), {"n": 3})
+
+                assert list(AuditClient._audit_info_cache) == [("a",), ("c",)]
+                assert client._get_cached_audit_info(("b",)) is None
+
+    def test_splunk_search_query(self, mock_config_splunk_enabled):
+        """Test the Splunk search combines the configured prefix with the object filter."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_lines.return_value = []
+
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            with patch('ddi_toolkit.audit.requests.Session.post', return_value=mock_response) as mock_post:
+                client = AuditClient()
+                client._get_splunk_audit("10.20.30.0/24", max_results=5)
+
+                query = mock_post.call_args.kwargs["data"]["search"]
+                assert query.startswith('search index="infoblox_audit" ("10.20.30.0/24") | sort -_time | head 5 | eval ')
+                assert "message=coalesce(message, _raw)" in query
+                assert query.endswith("src, dest")
+
+    def test_splunk_auth_failure_cached(self, mock_config_splunk_enabled):
+        """Test a Splunk auth failure is returned from cache until its TTL passes."""
+        mock_response = Mock()
+        mock_response.status_code = 401
+
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            with patch('ddi_toolkit.audit.requests.Session.post', return_value=mock_response) as mock_post:
+                client = AuditClient()
+                first = client._get_splunk_audit("10.20.30.0/24", "NETWORK")
+                second = client._get_splunk_audit("10.20.40.0/24", "NETWORK")
+
+                assert first == second
+                assert "authentication" in second[0]["error"].lower()
+                assert mock_post.call_count == 1
+
+                client._splunk_error_ttl = 0
+                client._get_splunk_audit("10.20.40.0/24", "NETWORK")
+                assert mock_post.call_count == 2
+
+    def test_splunk_session_reused(self, mock_config_splunk_enabled):
+        """Test Splunk queries share one keep-alive session."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_lines.return_value = []
+
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_enabled):
+            with patch('ddi_toolkit.audit.requests.Session.post', return_value=mock_response) as mock_post:
+                client = AuditClient()
+                client._get_splunk_audit("10.20.30.0/24", "NETWORK")
+                session = client._session
+                client._get_splunk_audit("10.20.40.0/24", "NETWORK")
+
+                assert client._session is session
+                assert session.verify is False
+                assert mock_post.call_count == 2
+                assert mock_post.call_args.kwargs.get('timeout') == (5, 30)
+
+
+class TestParseSplunkLine:
+    """Tests for _parse_splunk_line helper."""
+
+    @pytest.mark.parametrize("backend", ["simdjson", "orjson", "json"])
+    def test_parse_splunk_line(self, backend):
+        """Test result extraction with each JSON backend."""
+        import json
+        import ddi_toolkit.audit as audit_module
+
+        parser = audit_module._simdjson_parser if backend == "simdjson" else None
+        if backend == "simdjson" and parser is None:
+            pytest.skip("simdjson not installed")
+        loads = json.loads
+        if backend == "orjson":
+            orjson = pytest.importorskip("orjson")
+            loads = orjson.loads
+
+        with patch.object(audit_module, '_simdjson_parser', parser), \
+                patch.object(audit_module, '_json_loads', loads):
+            assert audit_module._parse_splunk_line('{"result": {"admin": "jsmith"}}') == {"admin": "jsmith"}
+            assert audit_module._parse_splunk_line(b'{"result": {"admin": "adoe"}}') == {"admin": "adoe"}
+            assert audit_module._parse_splunk_line('{"preview": false}') is None
+            assert audit_module._parse_splunk_line('not json') is None
+
 
 class TestParseTimestamp:
     """Tests for _parse_timestamp function."""
@@ -305,6 +573,29 @@ class TestGetAuditForObject:
                 assert "source" in result
                 assert "timestamps" in result
 
+    def test_audit_client_reused_until_reset(self):
+        """Test convenience function reuses one client until reset."""
+        with patch('ddi_toolkit.audit.load_config', return_value={}) as mock_load:
+            first = get_audit_client()
+            assert get_audit_client() is first
+            assert mock_load.call_count == 1
+
+            reset_audit_client()
+            assert get_audit_client() is not first
+
+    def test_get_audit_for_objects_preserves_order(self):
+        """Test batch lookup returns one result per item, in order."""
+        with patch('ddi_toolkit.audit.load_config', return_value={"splunk": {"enabled": False}}):
+            with patch.object(AuditClient, '_get_fileop_audit', return_value=[]) as mock_fileop:
+                results = get_audit_for_objects([
+                    ("range/a:10.0.0.10/default", "RANGE", "10.0.0.10-10.0.0.20"),
+                    ("range/b:10.0.1.10/default", "RANGE", "10.0.1.10-10.0.1.20"),
+                ], max_results=3)
+
+                assert len(results) == 2
+                searched = [c.args[0] for c in mock_fileop.call_args_list]
+                assert searched == ["10.0.0.10-10.0.0.20", "10.0.1.10-10.0.1.20"]
+
 
 class TestFileopAudit:
     """Tests for WAPI fileop audit functionality."""
@@ -414,6 +705,101 @@ class TestFileopAudit:
             assert len(results) == 1
             assert results[0]["object_type"] == "NETWORK"
 
+    def test_get_fileop_audit_uses_token_index(self, mock_config_splunk_disabled):
+        """Test whole-token hits come from the index, partial names fall back to a scan."""
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_disabled):
+            client = AuditClient()
+
+            client._audit_log_cache = [
+                {"message": "INSERT NETWORK 10.99.1.0/24", "raw": "", "admin": "jsmith"},
+                {"message": "INSERT ZONE example.com", "raw": "", "admin": "admin"},
+                {"message": "UPDATE NETWORK 10.99.1.0/24", "raw": "", "admin": "admin"}
+            ]
+            client._audit_log_cache_time = datetime.now()
+
+            results = client._get_fileop_audit("10.99.1.0/24")
+            assert [r["admin"] for r in results] == ["jsmith", "admin"]
+            assert set(AuditClient._token_index["10.99.1.0"]) == {0, 2}
+
+            # Not a whole token, found by the full scan
+            results = client._get_fileop_audit("example")
+            assert len(results) == 1
+
+    def test_get_fileop_audit_finds_quoted_names(self, mock_config_splunk_disabled):
+        """Test names in quotes or brackets are indexed next to bare ones."""
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_disabled):
+            client = AuditClient()
+
+            client._audit_log_cache = [
+                {"message": 'Modified Network "10.99.1.0/24"', "raw": "", "timestamp": "2024-01-16", "admin": "alice"},
+                {"message": "Deleted Network [10.99.2.0/24]", "raw": "", "timestamp": "2024-01-16", "admin": "carol"},
+                {"message": "Inserted Network 10.99.1.0/24", "raw": "", "timestamp": "2024-01-15", "admin": "bob"}
+            ]
+            client._audit_log_cache_time = datetime.now()
+
+            results = client._get_fileop_audit("10.99.1.0/24")
+            assert [r["admin"] for r in results] == ["alice", "bob"]
+
+            results = client._get_fileop_audit("10.99.2.0/24")
+            assert [r["admin"] for r in results] == ["carol"]
+
+    def test_get_fileop_audit_matches_inside_longer_tokens(self, mock_config_splunk_disabled):
+        """Test a bare-token entry does not hide matches inside longer tokens."""
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_disabled):
+            client = AuditClient()
+
+            client._audit_log_cache = [
+                {"message": "Modified HostRecord web01.example.com", "raw": "", "admin": "alice"},
+                {"message": "Deleted web01", "raw": "", "admin": "bob"},
+                {"message": "Modified zone example.com.", "raw": "", "admin": "carol"},
+                {"message": "Created example.com", "raw": "", "admin": "dave"}
+            ]
+            client._audit_log_cache_time = datetime.now()
+
+            results = client._get_fileop_audit("web01")
+            assert [r["admin"] for r in results] == ["alice", "bob"]
+
+            results = client._get_fileop_audit("example.com")
+            assert [r["admin"] for r in results] == ["alice", "carol", "dave"]
+
+    def test_fileop_audit_disabled_in_config(self):
+        """Test fileop audit is skipped when disabled in config."""
+        config = {"splunk": {"enabled": False}, "infoblox": {"fileop_audit": False}}
+        with patch('ddi_toolkit.audit.load_config', return_value=config):
+            client = AuditClient()
+
+            with patch.object(client, '_get_cached_audit_log') as mock_cached:
+                assert client._get_fileop_audit("10.99.1.0/24") == []
+                mock_cached.assert_not_called()
+
+    def test_no_audit_source_skips_lookup(self):
+        """Test lookups short-circuit when neither source can answer."""
+        config = {"splunk": {"enabled": False}, "infoblox": {"fileop_audit": False}}
+        with patch('ddi_toolkit.audit.load_config', return_value=config):
+            client = AuditClient()
+            assert client.is_available() is False
+
+            with patch.object(client, '_audit_for_term') as mock_lookup:
+                result = client.get_object_audit("network/ZG5z:10.99.1.0/24/default", "NETWORK")
+                mock_lookup.assert_not_called()
+
+            assert result["source"] == "none"
+            assert "not configured" in result["message"]
+
+    def test_fileop_audit_unavailable_is_remembered(self, mock_config_splunk_disabled):
+        """Test a refused fileop request is not retried."""
+        fileop_resp = Mock()
+        fileop_resp.status_code = 403
+
+        with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_disabled):
+            with patch('ddi_toolkit.audit.get_infoblox_creds', return_value=("gm", "admin", "pw", "2.13.1", False, 30)):
+                with patch('ddi_toolkit.audit.requests.Session.post', return_value=fileop_resp) as mock_post:
+                    client = AuditClient()
+
+                    assert client._get_fileop_audit("10.99.1.0/24") == []
+                    assert client._get_fileop_audit("10.99.2.0/24") == []
+                    assert mock_post.call_count == 1
+
     def test_audit_cache_expiration(self, mock_config_splunk_disabled):
         """Test that audit cache expires after TTL."""
         with patch('ddi_toolkit.audit.load_config', return_value=mock_config_splunk_disabled):
@@ -447,6 +833,49 @@ class TestFileopAudit:
                 mock_download.assert_not_called()
                 assert entries[0]["message"] == "cached entry"
 
+    def test_audit_cache_persisted_to_disk(self):
+        """Test a downloaded audit log is reused from disk by a new process."""
+        config = {"splunk": {"enabled": False}, "infoblox": {"grid_master": "gm.example.com"}}
+        entries = [AuditEntry("INSERT NETWORK 10.99.1.0/24", admin="jsmith", action="INSERT")]
+
+        with patch('ddi_toolkit.audit.load_config', return_value=config):
+            client = AuditClient()
+            with patch.object(client, '_download_audit_log', return_value=entries):
+                assert client._get_cached_audit_log() == entries
+
+            # Simulate a fresh process: in-memory cache gone
+            reset_audit_client()
+            client = AuditClient()
+            with patch.object(client, '_download_audit_log') as mock_download:
+                loaded = client._get_cached_audit_log()
+                assert [e.as_dict() for e in loaded] == [e.as_dict() for e in entries]
+                mock_download.assert_not_called()
+
+    def test_audit_entry_dict_access(self):
+        """Test parsed entries read like dicts and are handed out as dicts."""
+        entry = AuditEntry("2024-01-15 10:30:00 admin=jsmith INSERT NETWORK", admin="jsmith")
+
+        assert entry["admin"] == "jsmith"
+        assert entry.get("message") == entry.raw
+        assert entry.get("object", "none") == "none"
+        with pytest.raises(KeyError):
+            entry["object"]
+        assert entry.as_dict()["action"] is None
+
+    def test_audit_disk_cache_expired(self):
+        """Test a stale disk cache triggers a fresh download."""
+        config = {"splunk": {"enabled": False}, "infoblox": {"grid_master": "gm.example.com"}}
+
+        with patch('ddi_toolkit.audit.load_config', return_value=config):
+            client = AuditClient()
+            client._save_disk_cache([{"message": "old entry"}])
+            client._cache_ttl = 0
+
+            with patch.object(client, '_download_audit_log', return_value=[{"message": "new entry"}]):
+                entries = client._get_cached_audit_log()
+
+                assert entries[0]["message"] == "new entry"
+
     def test_splunk_fallback_to_fileop(self):
         """Test fallback from Splunk to fileop when Splunk fails."""
         mock_config = {
@@ -495,12 +924,14 @@ class TestFileopAudit:
                 archive = self._create_mock_audit_archive(log_content)
                 download_resp = Mock()
                 download_resp.status_code = 200
-                download_resp.content = archive
+                download_resp.raw = io.BytesIO(archive)
 
-                with patch('ddi_toolkit.audit.requests.post', side_effect=[fileop_resp, download_resp]):
+                with patch('ddi_toolkit.audit.requests.Session.post', side_effect=[fileop_resp, download_resp]) as mock_post:
                     entries = client._download_audit_log()
 
                     assert len(entries) >= 1
+                    assert mock_post.call_args.kwargs.get('stream') is True
+                    download_resp.close.assert_called_once()
 
 
 class TestDownloadFullAuditLog:
@@ -519,14 +950,41 @@ class TestDownloadFullAuditLog:
 
         download_resp = Mock()
         download_resp.status_code = 200
-        download_resp.content = b"test archive content"
+        download_resp.raw = io.BytesIO(b"test archive content")
 
         with patch('ddi_toolkit.audit.get_infoblox_creds', return_value=mock_creds):
-            with patch('ddi_toolkit.audit.requests.post', side_effect=[fileop_resp, download_resp]):
+            with patch('ddi_toolkit.audit.requests.Session.post', side_effect=[fileop_resp, download_resp]):
                 success, message = download_full_audit_log()
 
                 assert success is True
                 assert "20 bytes" in message
+                download_resp.close.assert_called_once()
+
+    def test_download_full_audit_log_to_file(self, tmp_path):
+        """Test the archive is streamed into the output file."""
+        mock_creds = ("192.168.1.224", "admin", "infoblox", "2.13.1", False, 30)
+
+        fileop_resp = Mock()
+        fileop_resp.status_code = 200
+        fileop_resp.json.return_value = {
+            "url": "https://192.168.1.224/download",
+            "token": "test-token"
+        }
+
+        download_resp = Mock()
+        download_resp.status_code = 200
+        download_resp.raw = io.BytesIO(b"test archive content")
+
+        output_path = tmp_path / "audit.tar.gz"
+
+        with patch('ddi_toolkit.audit.get_infoblox_creds', return_value=mock_creds):
+            with patch('ddi_toolkit.audit.requests.Session.post', side_effect=[fileop_resp, download_resp]) as mock_post:
+                success, message = download_full_audit_log(str(output_path))
+
+                assert success is True
+                assert message == str(output_path)
+                assert output_path.read_bytes() == b"test archive content"
+                assert mock_post.call_args.kwargs.get('stream') is True
 
     def test_download_full_audit_log_failure(self):
         """Test handling download failure."""
@@ -536,7 +994,7 @@ class TestDownloadFullAuditLog:
         fileop_resp.status_code = 500
 
         with patch('ddi_toolkit.audit.get_infoblox_creds', return_value=mock_creds):
-            with patch('ddi_toolkit.audit.requests.post', return_value=fileop_resp):
+            with patch('ddi_toolkit.audit.requests.Session.post', return_value=fileop_resp):
                 success, message = download_full_audit_log()
 
                 assert success is False
@@ -4,6 +4,7 @@ Tests for command modules.
 
 import pytest
 import json
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, Mock, MagicMock, PropertyMock
 
@@ -34,6 +35,15 @@ class TestCommandRegistry:
         cmd = get_command("invalid_command")
         assert cmd is None
 
+    def test_builtin_registry_matches_command_classes(self):
+        """Test the static name/alias map agrees with each command class."""
+        from ddi_toolkit.commands import _COMMAND_MODULES, _COMMAND_ALIASES
+
+        for name in _COMMAND_MODULES:
+            cmd = get_command(name)
+            assert cmd is not None and cmd.name == name
+            assert {alias for alias, target in _COMMAND_ALIASES.items() if target == name} == set(cmd.aliases)
+
     def test_list_commands(self):
         """Test listing all commands."""
         commands = list_commands()
@@ -101,6 +111,59 @@ class TestNetworkCommand:
                 assert "active_leases" in result
                 assert "audit" in result
 
+    def test_network_execute_minimal_fields(self, network_command, mock_network_response):
+        """Test detail=False asks WAPI for the reduced field lists."""
+        mock_client = Mock()
+
+        def mock_get(obj, **kwargs):
+            return mock_network_response if obj == "network" else []
+
+        mock_client.get = Mock(side_effect=mock_get)
+
+        cmd = network_command()
+        cmd._client = mock_client
+        result = cmd.execute("10.20.30.0/24", detail=False, include_audit=False, include_ips=False)
+
+        assert result["network"] == "10.20.30.0/24"
+        fields = {c[0][0]: c[1]["return_fields"] for c in mock_client.get.call_args_list}
+        assert fields["network"] == network_command.RETURN_FIELDS_MINIMAL
+        assert fields["range"] == network_command.RANGE_RETURN_FIELDS_MINIMAL
+
+    def test_network_execute_summary_only(self, network_command, mock_network_response):
+        """Test summary_only returns just the summary section."""
+        mock_client = Mock()
+        mock_client.get = Mock(side_effect=lambda obj, **kwargs: mock_network_response if obj == "network" else [])
+
+        cmd = network_command()
+        cmd._client = mock_client
+        result = cmd.execute("10.20.30.0/24", summary_only=True, include_audit=False)
+
+        assert list(result) == ["_summary"]
+        assert result["_summary"]["Network"] == "10.20.30.0/24"
+        assert result["_summary"]["DHCP Ranges"] == 0
+
+    def test_dhcp_servers_fetched_in_one_call(self, network_command):
+        """Test member DHCP properties are looked up in a single query."""
+        mock_client = Mock()
+        mock_client.get = Mock(return_value=[
+            {"host_name": "dhcp1.example.com", "ipv4addr": "10.0.0.1"},
+            {"host_name": "dhcp2.example.com", "ipv4addr": "10.0.0.2"},
+        ])
+
+        cmd = network_command()
+        cmd._client = mock_client
+        servers = cmd._get_dhcp_servers([
+            {"member": {"name": "dhcp1.example.com"}},
+            {"member": "dhcp2.example.com"},
+            {"member": "dhcp1.example.com"},
+        ])
+
+        assert mock_client.get.call_count == 1
+        params = mock_client.get.call_args[1]["params"]
+        assert params["host_name~"].startswith("^(")
+        assert "dhcp1\\.example\\.com" in params["host_name~"]
+        assert sorted(s["host_name"] for s in servers) == ["dhcp1.example.com", "dhcp2.example.com"]
+
     def test_network_execute_not_found(self, network_command):
         """Test network query when not found."""
         mock_client = Mock()
@@ -287,6 +350,10 @@ class TestDHCPCommand:
                 assert "leases" in result
                 assert "statistics" in result
 
+                lease = result["leases"][0]
+                assert lease["starts_formatted"] == datetime.fromtimestamp(1701388800).strftime("%Y-%m-%d %H:%M:%S")
+                assert "tstp_formatted" not in lease
+
     def test_dhcp_invalid_query_type(self, dhcp_command):
         """Test DHCP with invalid query type."""
         mock_client = Mock()
@@ -330,6 +397,69 @@ class TestSearchCommand:
                 assert "results" in result
                 assert "statistics" in result
 
+    def test_search_types_run_concurrently(self, search_command):
+        """Test per-type searches keep their order when run in parallel."""
+        def fake_get(obj_type, params=None, return_fields=None, max_results=None):
+            return [{"_ref": f"{obj_type}/{list(params)[0]}"}]
+
+        mock_client = Mock()
+        mock_client.get = Mock(side_effect=fake_get)
+
+        cmd = search_command()
+        cmd._client = mock_client
+        result = cmd.execute("all:web")
+
+        assert list(result["results"]) == [
+            "host_records", "a_records", "cname_records", "ptr_records",
+            "mx_records", "txt_records", "srv_records", "ns_records",
+            "zones", "networks", "containers", "fixed_addresses"
+        ]
+        assert result["results"]["cname_records"] == [
+            {"_ref": "record:cname/name~"}, {"_ref": "record:cname/canonical~"}
+        ]
+
+    def test_search_resolves_client_before_threads(self, search_command):
+        """Test the WAPI client is created once, on the calling thread."""
+        mock_client = Mock()
+        mock_client.get = Mock(return_value=[])
+
+        with patch('ddi_toolkit.commands.base.get_client', return_value=mock_client) as mock_get_client:
+            cmd = search_command()
+            cmd.execute("all:web")
+
+        assert mock_get_client.call_count == 1
+
+    def test_network_search_skips_cidr_when_full(self, search_command):
+        """Test the CIDR query is skipped once comment matches fill max_results."""
+        mock_client = Mock()
+        mock_client.get = Mock(return_value=[{"_ref": "network/a"}, {"_ref": "network/b"}])
+
+        cmd = search_command()
+        cmd._client = mock_client
+        results = cmd._search_object_type("network", "prod", {}, max_results=2)
+
+        assert mock_client.get.call_count == 1
+        assert [r["_ref"] for r in results] == ["network/a", "network/b"]
+
+        mock_client.get.reset_mock()
+        results = cmd._search_object_type("network", "prod", {}, max_results=5)
+
+        # Overlapping rows from the second query are dropped
+        assert mock_client.get.call_count == 2
+        assert [r["_ref"] for r in results] == ["network/a", "network/b"]
+
+    def test_full_search_skips_dns_types_for_cidr(self, search_command):
+        """Test all: searches for a CIDR skip record and zone queries."""
+        mock_client = Mock()
+        mock_client.get = Mock(return_value=[])
+
+        cmd = search_command()
+        cmd._client = mock_client
+        cmd.execute("all:10.20.30.0/24")
+
+        searched = {c[0][0] for c in mock_client.get.call_args_list}
+        assert searched == {"network", "networkcontainer", "fixedaddress"}
+
 
 class TestSearchInputDetection:
     """Tests for intelligent search input detection."""
@@ -18,6 +18,9 @@ from ddi_toolkit.config import (
     save_config,
     config_exists,
     is_configured,
+    get_infoblox_creds,
+    get_view_settings,
+    set_view_settings,
     DEFAULT_CONFIG
 )
 
@@ -92,6 +95,51 @@ class TestConfigFile:
                 saved = json.load(f)
             assert saved["infoblox"]["grid_master"] == mock_config["infoblox"]["grid_master"]
 
+    def test_load_config_cached_until_saved(self, tmp_path, mock_config):
+        """Test config is parsed once and re-read after save_config."""
+        config_path = tmp_path / "test_config.json"
+        with patch('ddi_toolkit.config.CONFIG_FILE', config_path):
+            save_config(mock_config)
+
+            with patch('ddi_toolkit.config.json.load', wraps=json.load) as mock_json_load:
+                first = load_config()
+                second = load_config()
+                assert mock_json_load.call_count == 1
+
+            # Callers get their own copy
+            first["infoblox"]["grid_master"] = "changed"
+            assert second["infoblox"]["grid_master"] == mock_config["infoblox"]["grid_master"]
+
+            updated = dict(mock_config, infoblox=dict(mock_config["infoblox"], grid_master="10.0.0.1"))
+            save_config(updated)
+            assert load_config()["infoblox"]["grid_master"] == "10.0.0.1"
+
+    def test_infoblox_creds_cached_until_saved(self, tmp_path, mock_config):
+        """Test credentials are decoded once per config file version."""
+        config_path = tmp_path / "test_config.json"
+        with patch('ddi_toolkit.config.CONFIG_FILE', config_path):
+            save_config(mock_config)
+
+            with patch('ddi_toolkit.config.decode_password', wraps=decode_password) as mock_decode:
+                first = get_infoblox_creds()
+                assert get_infoblox_creds() == first
+                assert mock_decode.call_count == 1
+
+            updated = dict(mock_config, infoblox=dict(mock_config["infoblox"], username="operator"))
+            save_config(updated)
+            assert get_infoblox_creds()[1] == "operator"
+
+    def test_set_view_settings_reuses_config(self, tmp_path, mock_config):
+        """Test view settings update a passed-in config and save it."""
+        config_path = tmp_path / "test_config.json"
+        with patch('ddi_toolkit.config.CONFIG_FILE', config_path):
+            config = json.loads(json.dumps(mock_config))
+            saved = set_view_settings("specific", "corp", config=config)
+
+            assert saved is config
+            assert get_view_settings(config)["network_view"] == "corp"
+            assert get_view_settings()["view_mode"] == "specific"
+
     def test_config_exists_true(self, temp_config_file):
         """Test config_exists returns True when file exists."""
         with patch('ddi_toolkit.config.CONFIG_FILE', temp_config_file):
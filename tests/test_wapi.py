@@ -135,6 +135,55 @@ class TestWAPIClient:
                 call_kwargs = mock_req.call_args[1]
                 assert "_return_fields+" in call_kwargs['params']
 
+    def test_get_reuses_recent_result(self, mock_credentials, mock_network_response):
+        """Test identical GETs are served from cache until a write."""
+        with patch('ddi_toolkit.wapi.get_infoblox_creds', return_value=mock_credentials):
+            client = WAPIClient()
+
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = json.dumps({"result": mock_network_response})
+            mock_response.json.return_value = {"result": mock_network_response}
+
+            with patch.object(client.session, 'request', return_value=mock_response) as mock_req:
+                first = client.get("network", params={"network": "10.20.30.0/24"})
+                first[0]["comment"] = "changed by caller"
+                second = client.get("network", params={"network": "10.20.30.0/24"})
+
+                assert mock_req.call_count == 1
+                assert second[0].get("comment") != "changed by caller"
+
+                client.get("network", params={"network": "10.20.30.0/24"}, use_cache=False)
+                assert mock_req.call_count == 2
+
+                mock_response.text = json.dumps("network/ZG5z:10.0.0.0/24/default")
+                mock_response.json.return_value = "network/ZG5z:10.0.0.0/24/default"
+                client.delete("network/ZG5z:10.0.0.0/24/default")
+
+                mock_response.text = json.dumps({"result": mock_network_response})
+                mock_response.json.return_value = {"result": mock_network_response}
+                client.get("network", params={"network": "10.20.30.0/24"})
+                assert mock_req.call_count == 4
+
+    def test_get_does_not_cache_large_results(self, mock_credentials):
+        """Test results above the row limit are fetched fresh each time."""
+        with patch('ddi_toolkit.wapi.get_infoblox_creds', return_value=mock_credentials):
+            client = WAPIClient()
+            rows = [{"address": f"10.0.0.{i}"} for i in range(3)]
+
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = json.dumps({"result": rows})
+            mock_response.json.return_value = {"result": rows}
+
+            with patch.object(WAPIClient, '_get_cache_max_rows', 2):
+                with patch.object(client.session, 'request', return_value=mock_response) as mock_req:
+                    client.get("lease", params={"network": "10.0.0.0/24"})
+                    client.get("lease", params={"network": "10.0.0.0/24"})
+
+                    assert mock_req.call_count == 2
+                    assert client._get_cache == {}
+
     def test_test_connection_success(self, mock_credentials):
         """Test successful connection test."""
         with patch('ddi_toolkit.wapi.get_infoblox_creds', return_value=mock_credentials):